@@ -1,4 +1,20 @@
-from .collector import Collector
-from .model.game_data import GameDataModel
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .collector import Collector
+    from .model.game_data import GameDataModel
 
 __all__ = ["Collector", "GameDataModel"]
+
+
+def __getattr__(name: str) -> Any:
+    # resolved lazily so light entry points (e.g. the cli's help) don't import pandas & co.
+    if name == "Collector":
+        from .collector import Collector
+
+        return Collector
+    if name == "GameDataModel":
+        from .model.game_data import GameDataModel
+
+        return GameDataModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import argparse
-import json
+import importlib.util
+import mmap
+import re
 import sys
 from pathlib import Path
-from typing import Any, Iterable
+from typing import IO, TYPE_CHECKING, Any, Iterable
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
-from gameinsights.collector import Collector, SourceConfig
+# pandas and the collector (which pulls in every source) are imported where they are used,
+# so `--help`, usage and argument errors don't pay for them.
+
+# appid files are either one appid per line or comma separated
+_APPID_TOKEN = re.compile(rb"[^\s,]+")
 
 
 def _read_appids(appids: Iterable[str], appid_file: str | None) -> list[str]:
@@ -18,61 +25,160 @@ def _read_appids(appids: Iterable[str], appid_file: str | None) -> list[str]:
         path = Path(appid_file)
         if not path.exists():
             raise FileNotFoundError(f"Appid file not found: {appid_file}")
-        file_text = path.read_text(encoding="utf-8")
-        for raw in file_text.replace(",", "\n").splitlines():
-            normalized = raw.strip()
-            if normalized:
-                collected.append(normalized)
-
-    unique_ids: list[str] = []
-    seen: set[str] = set()
-    for value in collected:
-        if value not in seen:
-            unique_ids.append(value)
-            seen.add(value)
-    return unique_ids
-
-
-def _build_source_index(configs: Iterable[SourceConfig]) -> dict[str, set[str]]:
-    index: dict[str, set[str]] = {}
-    for config in configs:
-        source_name = config.source.__class__.__name__.lower()
-        index.setdefault(source_name, set()).update(config.fields)
-    return index
+        # mmap avoids holding a decoded copy of large appid files in memory
+        if path.is_file() and path.stat().st_size > 0:
+            with (
+                path.open("rb") as handle,
+                mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            ):
+                collected.extend(
+                    match.group().decode("utf-8") for match in _APPID_TOKEN.finditer(mapped)
+                )
+        elif not path.is_file():
+            # pipes, /dev/stdin and process substitution report a size of 0, read them line by line
+            with path.open("rb") as handle:
+                for line in handle:
+                    collected.extend(
+                        match.group().decode("utf-8") for match in _APPID_TOKEN.finditer(line)
+                    )
+
+    # dedupe while preserving order
+    return list(dict.fromkeys(collected))
 
 
 def _filter_records(
-    records: list[dict[str, Any]], allowed_fields: set[str]
-) -> list[dict[str, Any]]:
+    records: list[dict[str, Any]] | pd.DataFrame, allowed_fields: set[str]
+) -> list[dict[str, Any]] | pd.DataFrame:
     if not allowed_fields:
         return records
+    import pandas as pd
+
+    if isinstance(records, pd.DataFrame):
+        # a single column selection instead of rebuilding every row
+        selected: pd.DataFrame = records[
+            [column for column in records.columns if column in allowed_fields]
+        ]
+        return selected
     return [
         {key: value for key, value in record.items() if key in allowed_fields}
         for record in records
     ]
 
 
+def _games_frame(records: list[dict[str, Any]], recap: bool) -> pd.DataFrame:
+    """Build the games frame with the model's known columns and dtypes."""
+    import pandas as pd
+
+    from gameinsights.model import GameDataModel
+
+    fields = GameDataModel.model_fields
+    columns = GameDataModel._RECAP_FIELDS if recap else tuple(fields)
+    frame = pd.DataFrame.from_records(records, columns=columns)
+    # nullable ints, so a game missing a value doesn't turn the whole column into floats
+    typed: pd.DataFrame = frame.astype(
+        {column: "Int64" for column in columns if fields[column].annotation == int | None}
+    )
+    return typed
+
+
+def _prepare_destination(output_path: str | None) -> Path | None:
+    if not output_path:
+        return None
+    destination = Path(output_path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    return destination
+
+
+def _write_json(data: list[dict[str, Any]] | pd.DataFrame, handle: IO[str]) -> None:
+    import pandas as pd
+
+    if isinstance(data, pd.DataFrame):
+        # serialize straight from the frame, skipping the list-of-dicts roundtrip
+        data.to_json(
+            handle,
+            orient="records",
+            indent=2,
+            date_format="iso",
+            force_ascii=False,
+            default_handler=str,
+        )
+    else:
+        from gameinsights.utils import serialization
+
+        # orjson writes utf-8, so non-ascii game names are kept as-is instead of \uXXXX escapes
+        handle.write(
+            serialization.dumps(data, default=str, option=serialization.OPT_INDENT_2).decode()
+        )
+
+
+def _write_jsonl(data: Iterable[dict[str, Any]] | pd.DataFrame, handle: IO[str]) -> None:
+    import pandas as pd
+
+    if isinstance(data, pd.DataFrame):
+        data.to_json(
+            handle,
+            orient="records",
+            lines=True,
+            date_format="iso",
+            force_ascii=False,
+            default_handler=str,
+        )
+        return
+
+    from gameinsights.utils import serialization
+
+    # one record per line, written as each arrives so nothing is held until the end
+    for record in data:
+        handle.write(serialization.dumps(record, default=str).decode())
+        handle.write("\n")
+        handle.flush()
+
+
+# binary formats need an output file and the optional pyarrow dependency
+_BINARY_FORMATS = frozenset({"parquet", "feather"})
+
+
+def _output_jsonl(data: Iterable[dict[str, Any]] | pd.DataFrame, output_path: str | None) -> None:
+    destination = _prepare_destination(output_path)
+    if destination is None:
+        _write_jsonl(data, sys.stdout)
+    else:
+        with destination.open("w", encoding="utf-8") as handle:
+            _write_jsonl(data, handle)
+
+
 def _output_data(
     data: list[dict[str, Any]] | pd.DataFrame, fmt: str, output_path: str | None
 ) -> None:
+    if fmt == "jsonl":
+        _output_jsonl(data, output_path)
+        return
+
+    destination = _prepare_destination(output_path)
+
     if fmt == "json":
-        payload = data.to_dict(orient="records") if isinstance(data, pd.DataFrame) else data
-        rendered = json.dumps(payload, indent=2, default=str)
-        if output_path:
-            destination = Path(output_path)
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            destination.write_text(rendered, encoding="utf-8")
+        if destination is None:
+            _write_json(data, sys.stdout)
+            sys.stdout.write("\n")
         else:
-            print(rendered)
+            with destination.open("w", encoding="utf-8") as handle:
+                _write_json(data, handle)
         return
 
+    import pandas as pd
+
     frame = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
-    if output_path:
-        destination = Path(output_path)
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        frame.to_csv(destination, index=False)
-    else:
-        print(frame.to_csv(index=False), end="")
+    if fmt in _BINARY_FORMATS:
+        if destination is None:
+            raise ValueError(f"The {fmt} format requires an output path.")
+        if fmt == "parquet":
+            frame.to_parquet(destination, compression="zstd", index=False)
+        else:
+            frame.to_feather(destination, compression="lz4")
+        return
+
+    # write straight to the target instead of rendering the whole csv into a string first
+    frame.to_csv(destination if destination is not None else sys.stdout, index=False)
 
 
 def build_collect_parser() -> argparse.ArgumentParser:
@@ -106,9 +212,12 @@ def build_collect_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--format",
         "-F",
-        choices=["json", "csv"],
+        choices=["json", "jsonl", "csv", "parquet", "feather"],
         default="json",
-        help="Output format.",
+        help=(
+            "Output format (jsonl writes each game as soon as it's fetched, "
+            "parquet and feather require --output and pyarrow)."
+        ),
     )
     parser.add_argument(
         "--output",
@@ -122,6 +231,9 @@ def build_collect_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--calls", type=int, default=60, help="Max calls per rate limit window.")
     parser.add_argument("--period", type=int, default=60, help="Rate limit period in seconds.")
+    parser.add_argument(
+        "--workers", type=int, default=8, help="Max number of appids fetched concurrently."
+    )
     parser.add_argument("--region", default="us", help="Steam Store region.")
     parser.add_argument("--language", default="english", help="Steam Store language.")
     parser.add_argument(
@@ -153,9 +265,23 @@ def _run_collect(args: argparse.Namespace) -> int:
         print("No appids supplied. Use --appid or --appid-file.", file=sys.stderr)
         return 1
 
+    if args.format in _BINARY_FORMATS:
+        if not args.output:
+            print(f"The {args.format} format requires --output.", file=sys.stderr)
+            return 1
+        if importlib.util.find_spec("pyarrow") is None:
+            print(
+                f"The {args.format} format requires pyarrow "
+                "(install it with the 'parquet' extra).",
+                file=sys.stderr,
+            )
+            return 1
+
     total = len(steam_appids)
     print(f"Collecting data for {total} appid(s)...", file=sys.stderr)
 
+    from gameinsights.collector import Collector
+
     collector = Collector(
         region=args.region,
         language=args.language,
@@ -163,17 +289,16 @@ def _run_collect(args: argparse.Namespace) -> int:
         gamalytic_api_key=args.gamalytic_api_key or None,
         calls=args.calls,
         period=args.period,
+        max_workers=args.workers,
     )
 
     verbose = not args.quiet
 
     selected_sources = {item.lower() for item in args.source}
-    id_index = _build_source_index(collector.id_based_sources)
-    name_index = _build_source_index(collector.name_based_sources)
-    available_sources = set(id_index.keys()) | set(name_index.keys())
+    source_fields = collector.source_fields_map
 
     if selected_sources:
-        unknown = selected_sources - available_sources
+        unknown = selected_sources - source_fields.keys()
         if unknown:
             print(
                 f"Unknown sources requested: {', '.join(sorted(unknown))}",
@@ -190,15 +315,34 @@ def _run_collect(args: argparse.Namespace) -> int:
         _output_data(frame, args.format, args.output)
         return 0
 
+    if selected_sources:
+        allowed_fields = {"steam_appid"}.union(
+            *(source_fields[entry] for entry in selected_sources)
+        )
+
+    if args.format == "jsonl":
+        # stream the games out as they're fetched instead of collecting them first
+        stream: Iterable[dict[str, Any]] = collector.iter_games_data(
+            steam_appids, recap=args.recap, verbose=verbose
+        )
+        if selected_sources:
+            stream = (
+                {key: value for key, value in record.items() if key in allowed_fields}
+                for record in stream
+            )
+        _output_jsonl(stream, args.output)
+        return 0
+
     records = collector.get_games_data(steam_appids, recap=args.recap, verbose=verbose)
+
+    # tabular formats need a frame anyway, so filter on the frame's columns
+    data: list[dict[str, Any]] | pd.DataFrame = (
+        records if args.format == "json" else _games_frame(records, recap=args.recap)
+    )
     if selected_sources:
-        allowed_fields: set[str] = {"steam_appid"}
-        for entry in selected_sources:
-            allowed_fields.update(id_index.get(entry, set()))
-            allowed_fields.update(name_index.get(entry, set()))
-        records = _filter_records(records, allowed_fields)
+        data = _filter_records(data, allowed_fields)
 
-    _output_data(records, args.format, args.output)
+    _output_data(data, args.format, args.output)
     return 0
 
 
@@ -1,18 +1,61 @@
-import time
-from typing import Any, Literal, NamedTuple
+from __future__ import annotations
 
-import pandas as pd
+import copy
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeVar
 
 from gameinsights import sources
 from gameinsights.model.game_data import GameDataModel
 from gameinsights.sources.base import SourceResult
 from gameinsights.utils import LoggerWrapper, metrics
+from gameinsights.utils.cache import TTLCache
 from gameinsights.utils.ratelimit import logged_rate_limited
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas (and numpy) are imported where the DataFrames are built, so callers that only
+# need dicts (e.g. get_games_data) don't pay for them.
+
+# SteamUser summary fields holding integers, kept as nullable ints in get_user_data's DataFrame
+_USER_INT_COLUMNS = (
+    "community_visibility_state",
+    "profile_state",
+    "last_log_off",
+    "time_created",
+    "loc_city_id",
+)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+@lru_cache(maxsize=None)
+def _fields_getter(fields: tuple[str, ...]) -> Callable[[dict[str, Any]], tuple[Any, ...]]:
+    """Build (once per field set) a getter returning the values of fields as a tuple."""
+    if len(fields) == 1:
+        (field,) = fields
+        return lambda data: (data[field],)
+    if not fields:
+        return lambda data: ()
+    return itemgetter(*fields)
+
 
 class SourceConfig(NamedTuple):
     source: sources.BaseSource
-    fields: list[str]
+    fields: tuple[str, ...]
+
+    def extract(self, data: dict[str, Any]) -> Iterator[tuple[str, Any]]:
+        """Get the configured fields as (field, value) pairs from a source's data."""
+        try:
+            return zip(self.fields, _fields_getter(self.fields)(data))
+        except KeyError:
+            # partial data, keep the configured fields the source did return
+            return ((field, data[field]) for field in self.fields if field in data)
 
 
 class Collector:
@@ -24,6 +67,10 @@ class Collector:
         gamalytic_api_key: str | None = None,
         calls: int = 60,
         period: int = 60,
+        max_workers: int = 8,
+        cache_ttl: float = 3600,
+        cache_size: int = 1024,
+        rate_limits: dict[str, tuple[int, int]] | None = None,
     ) -> None:
         """Initialize the collector with an optional API key.
         Args:
@@ -33,6 +80,10 @@ class Collector:
             gamalytic_api_key (str): Optional API key for Gamalytic API.
             calls (int): Max number of API calls allowed per period. Default is 60.
             period (int): Time period in seconds for the rate limit. Default is 60.
+            max_workers (int): Max number of threads used to fetch multiple ids concurrently. Default is 8.
+            cache_ttl (float): Seconds a fetched game is reused for repeated appids, 0 disables it. Default is 3600.
+            cache_size (int): Max number of games kept in that cache. Default is 1024.
+            rate_limits (dict[str, tuple[int, int]]): Optional (calls, period) budgets overriding the default of each source, keyed by source name (e.g. {"steamspy": (30, 60)}).
         """
         self._region = region
         self._language = language
@@ -40,9 +91,15 @@ class Collector:
         self._gamalytic_api_key = gamalytic_api_key
         self.calls = calls
         self.period = period
+        self.max_workers = max_workers
+        self._games_cache: TTLCache[str, GameDataModel] = TTLCache(
+            maxsize=cache_size, ttl=cache_ttl
+        )
 
         self._init_sources()
         self._init_sources_config()
+        if rate_limits:
+            self._apply_rate_limits(rate_limits)
 
         self._logger = LoggerWrapper(self.__class__.__name__)
 
@@ -63,12 +120,36 @@ class Collector:
         self.steamachievements = sources.SteamAchievements(api_key=self.steam_api_key)
         self.steamuser = sources.SteamUser(api_key=self.steam_api_key)
 
+    def _apply_rate_limits(self, rate_limits: dict[str, tuple[int, int]]) -> None:
+        """Override the fetch budget of the given sources."""
+        sources_by_name = {
+            source.name: source
+            for source in (
+                self.steamreview,
+                self.steamstore,
+                self.steamspy,
+                self.gamalytic,
+                self.steamcharts,
+                self.howlongtobeat,
+                self.steamachievements,
+                self.steamuser,
+            )
+        }
+        unknown = rate_limits.keys() - sources_by_name.keys()
+        if unknown:
+            raise ValueError(f"Unknown sources in rate_limits: {', '.join(sorted(unknown))}")
+
+        for name, (calls, period) in rate_limits.items():
+            if calls <= 0 or period <= 0:
+                raise ValueError(f"Invalid rate limit for {name}: calls and period must be > 0.")
+            sources_by_name[name].rate_limit = (calls, period)
+
     def _init_sources_config(self) -> None:
         """Initialize sources config."""
-        self._id_based_sources = [
+        self._id_based_sources: tuple[SourceConfig, ...] = (
             SourceConfig(
                 self.steamstore,
-                [
+                (
                     "steam_appid",
                     "name",
                     "developers",
@@ -83,41 +164,41 @@ class Collector:
                     "metacritic_score",
                     "release_date",
                     "content_rating",
-                ],
+                ),
             ),
             SourceConfig(
                 self.gamalytic,
-                ["average_playtime_h", "copies_sold", "estimated_revenue", "owners", "languages"],
+                ("average_playtime_h", "copies_sold", "estimated_revenue", "owners", "languages"),
             ),
-            SourceConfig(self.steamspy, ["ccu", "tags"]),
+            SourceConfig(self.steamspy, ("ccu", "tags")),
             SourceConfig(
                 self.steamcharts,
-                ["active_player_24h", "peak_active_player_all_time", "monthly_active_player"],
+                ("active_player_24h", "peak_active_player_all_time", "monthly_active_player"),
             ),
             SourceConfig(
                 self.steamreview,
-                [
+                (
                     "review_score",
                     "review_score_desc",
                     "total_positive",
                     "total_negative",
                     "total_reviews",
-                ],
+                ),
             ),
             SourceConfig(
                 self.steamachievements,
-                [
+                (
                     "achievements_count",
                     "achievements_percentage_average",
                     "achievements_list",
-                ],
+                ),
             ),
-        ]
+        )
 
-        self._name_based_sources = [
+        self._name_based_sources: tuple[SourceConfig, ...] = (
             SourceConfig(
                 self.howlongtobeat,
-                [
+                (
                     "comp_main",
                     "comp_plus",
                     "comp_100",
@@ -137,18 +218,30 @@ class Collector:
                     "review_score",
                     "count_playing",
                     "count_retired",
-                ],
+                ),
             ),
-        ]
+        )
+
+        # source name -> fields it provides, both lists are fixed after init
+        fields_map: dict[str, set[str]] = {}
+        for config in (*self._id_based_sources, *self._name_based_sources):
+            fields_map.setdefault(config.source.name, set()).update(config.fields)
+        self._source_fields_map = {
+            source_name: frozenset(fields) for source_name, fields in fields_map.items()
+        }
 
     @property
-    def id_based_sources(self) -> list[SourceConfig]:
+    def id_based_sources(self) -> tuple[SourceConfig, ...]:
         return self._id_based_sources
 
     @property
-    def name_based_sources(self) -> list[SourceConfig]:
+    def name_based_sources(self) -> tuple[SourceConfig, ...]:
         return self._name_based_sources
 
+    @property
+    def source_fields_map(self) -> dict[str, frozenset[str]]:
+        return self._source_fields_map
+
     @property
     def region(self) -> str:
         return self._region
@@ -158,6 +251,7 @@ class Collector:
         if self._region != value:
             self._region = value
             self.steamstore.region = value
+            self._games_cache.clear()
 
     @property
     def language(self) -> str:
@@ -168,6 +262,7 @@ class Collector:
         if self._language != value:
             self._language = value
             self.steamstore.language = value
+            self._games_cache.clear()
 
     @property
     def steam_api_key(self) -> str | None:
@@ -180,6 +275,7 @@ class Collector:
             self.steamstore.api_key = value
             self.steamachievements.api_key = value
             self.steamuser.api_key = value
+            self._games_cache.clear()
 
     @property
     def gamalytic_api_key(self) -> str | None:
@@ -190,6 +286,11 @@ class Collector:
         if self._gamalytic_api_key != value:
             self._gamalytic_api_key = value
             self.gamalytic.api_key = value
+            self._games_cache.clear()
+
+    def clear_cache(self) -> None:
+        """Drop the cached games, the next fetch of any appid goes back to the sources."""
+        self._games_cache.clear()
 
     def get_user_data(
         self,
@@ -204,15 +305,21 @@ class Collector:
             include_free_games (bool): If True, will include free games when fetching users' owned games list. Default to True.
             return_as (str): Return format, "list" for list of dicts, "dataframe" for pandas DataFrame. Default to "dataframe".
             verbose (bool): If True, will log the fetching process.
+
+        Behavior:
+            - Repeated steamids are fetched once, every occurrence still gets its own entry.
+            - The DataFrame always has one column per SteamUser label, integer fields as nullable Int64.
         """
         steamid_list = (
             [steamids] if isinstance(steamids, str) or isinstance(steamids, int) else steamids
         )
 
-        results = []
-        total = len(steamid_list)
+        # fetch every steamid once, duplicates are re-expanded afterwards
+        unique_steamids = list(dict.fromkeys(steamid_list))
+        total = len(unique_steamids)
 
-        for idx, steamid in enumerate(steamid_list, start=1):
+        def _fetch_one(item: tuple[int, str]) -> dict[str, Any] | None:
+            idx, steamid = item
             self.logger.log(
                 f"Fetching {idx} of {total}: user with steamid {steamid}",
                 level="info",
@@ -220,24 +327,44 @@ class Collector:
             )
 
             try:
-                fetch_result = self.steamuser.fetch(
-                    steamid=steamid, include_free_games=include_free_games, verbose=verbose
+                fetch_result = self._fetch_user_data(
+                    steamid, include_free_games=include_free_games, verbose=verbose
                 )
-                if fetch_result["success"]:
-                    user_data = fetch_result["data"]
-                    results.append(user_data)
-                else:
-                    user_data = {"steamid": steamid}
-                    results.append(user_data)
-
-                time.sleep(0.25)  # internal sleep to prevent over-calling
-            except Exception:
+            except Exception as e:
                 self.logger.log(
-                    f"Error fetching data for steamid {steamid}: e", level="error", verbose=True
+                    f"Error fetching data for steamid {steamid}: {e}", level="error", verbose=True
                 )
+                return None
+
+            user_data: dict[str, Any] = (
+                fetch_result["data"] if fetch_result["success"] else {"steamid": steamid}
+            )
+            return user_data
+
+        fetched = dict(
+            zip(
+                unique_steamids,
+                self._map_concurrently(_fetch_one, enumerate(unique_steamids, start=1)),
+            )
+        )
+
+        results: list[dict[str, Any]] = []
+        returned: set[str] = set()
+        for steamid in steamid_list:
+            user_data = fetched[steamid]
+            if user_data is None:
+                continue
+            results.append(copy.deepcopy(user_data) if steamid in returned else user_data)
+            returned.add(steamid)
 
         if return_as == "dataframe":
-            return pd.DataFrame(results)
+            import pandas as pd
+
+            frame = pd.DataFrame.from_records(results, columns=self.steamuser.valid_labels)
+            # a user without a value would otherwise turn the whole column into floats/objects
+            for column in _USER_INT_COLUMNS:
+                frame[column] = pd.to_numeric(frame[column], errors="coerce").astype("Int64")
+            return frame
 
         return results
 
@@ -257,6 +384,7 @@ class Collector:
         Behavior:
             - Returns an empty list if no data could be fetched.
             - Returns complete/partial data if all/any appids succeed.
+            - Repeated appids are fetched once, every occurrence still gets its own entry.
         """
 
         if not steam_appids:
@@ -265,26 +393,87 @@ class Collector:
         if isinstance(steam_appids, (str, int)):
             steam_appids = [steam_appids]
 
-        result = []
-        total = len(steam_appids)
-        for idx, appid in enumerate(steam_appids, start=1):
-            self.logger.log(
-                f"Fetching {idx} of {total} game data: steam appid {appid}..",
-                level="info",
-                verbose=verbose,
+        # fetch every appid once, duplicates are re-expanded afterwards
+        unique_appids = list(dict.fromkeys(steam_appids))
+        fetch_one = partial(
+            self._fetch_game_payload,
+            total=len(unique_appids),
+            recap=recap,
+            verbose=verbose,
+            now=datetime.now(),
+        )
+        fetched = dict(
+            zip(
+                unique_appids,
+                self._map_concurrently(fetch_one, enumerate(unique_appids, start=1)),
             )
-            try:
-                game_data = self._fetch_raw_data(appid, verbose=verbose)
-                payload = game_data.get_recap() if recap else game_data.model_dump()
-                result.append(payload)
-            except Exception as e:
-                self.logger.log(
-                    f"Error fecthing data for game {appid} with {e} error..",
-                    level="error",
-                    verbose=True,
-                )
+        )
 
-        return result
+        results: list[dict[str, Any]] = []
+        returned: set[str] = set()
+        for appid in steam_appids:
+            payload = fetched[appid]
+            if payload is None:
+                continue
+            # repeated appids get their own copy, so callers can mutate entries independently
+            results.append(copy.deepcopy(payload) if appid in returned else payload)
+            returned.add(appid)
+        return results
+
+    def iter_games_data(
+        self, steam_appids: str | list[str], recap: bool = False, verbose: bool = True
+    ) -> Iterator[dict[str, Any]]:
+        """Fetch game data like get_games_data, yielding each game as soon as it's available.
+        Args:
+            steam_appids (str | list[str]): steam_appid of the game(s) to fetch data for.
+            recap (bool): If True, will yield the recap data (for reference: check _RECAP_LABELS).
+            verbose (bool): If True, will log the fetching process.
+
+        Yields:
+            dict[str, Any]: The game data, in the order of steam_appids.
+
+        Behavior:
+            - Repeated appids are fetched and yielded once.
+            - Appids whose data couldn't be fetched are skipped.
+        """
+        if not steam_appids:
+            return
+
+        if isinstance(steam_appids, (str, int)):
+            steam_appids = [steam_appids]
+
+        unique_appids = list(dict.fromkeys(steam_appids))
+        fetch_one = partial(
+            self._fetch_game_payload,
+            total=len(unique_appids),
+            recap=recap,
+            verbose=verbose,
+            now=datetime.now(),
+        )
+        for payload in self._iter_concurrently(fetch_one, enumerate(unique_appids, start=1)):
+            if payload is not None:
+                yield payload
+
+    def _fetch_game_payload(
+        self, item: tuple[int, str], total: int, recap: bool, verbose: bool, now: datetime
+    ) -> dict[str, Any] | None:
+        """Fetch a single game as a dict, returns None (and logs) on failure."""
+        idx, appid = item
+        self.logger.log(
+            f"Fetching {idx} of {total} game data: steam appid {appid}..",
+            level="info",
+            verbose=verbose,
+        )
+        try:
+            game_data: GameDataModel = self._fetch_raw_data(appid, verbose=verbose, now=now)
+            return game_data.get_recap() if recap else game_data.model_dump()
+        except Exception as e:
+            self.logger.log(
+                f"Error fecthing data for game {appid} with {e} error..",
+                level="error",
+                verbose=True,
+            )
+            return None
 
     def get_games_active_player_data(
         self, steam_appids: str | list[str], fill_na_as: int = -1, verbose: bool = True
@@ -297,18 +486,24 @@ class Collector:
 
         Returns:
             pd.DataFrame: DataFrame containing active player data for all appids.
+
+        Behavior:
+            - Repeated appids are fetched once, every occurrence still gets its own row.
         """
+        import numpy as np
+        import pandas as pd
 
         if not steam_appids:
             return pd.DataFrame()
         if isinstance(steam_appids, (str, int)):
             steam_appids = [steam_appids]
 
-        all_months: set[str] = set()
-        all_data = []
-        total = len(steam_appids)
+        # fetch every appid once, duplicates are re-expanded afterwards
+        unique_appids = list(dict.fromkeys(steam_appids))
+        total = len(unique_appids)
 
-        for idx, appid in enumerate(steam_appids, start=1):
+        def _fetch_one(item: tuple[int, str]) -> tuple[dict[str, Any], dict[str, float]]:
+            idx, appid = item
             self.logger.log(
                 f"Fetching {idx} of {total}: active player data for appid {appid}..",
                 level="info",
@@ -316,7 +511,10 @@ class Collector:
             )
             game_record = {
                 "steam_appid": appid,
+                "name": None,
+                "peak_active_player_all_time": None,
             }
+            monthly_data: dict[str, float] = {}
 
             try:
                 active_player_data = self.steamcharts.fetch(
@@ -334,7 +532,6 @@ class Collector:
                         month["month"]: month["average_players"]
                         for month in active_player_data["data"].get("monthly_active_player", [])
                     }
-                    game_record.update(monthly_data)
                     game_record.update(
                         {
                             "name": active_player_data["data"].get("name"),
@@ -343,32 +540,49 @@ class Collector:
                             ),
                         }
                     )
-                    all_months.update(monthly_data.keys())
             except Exception as e:
                 self.logger.log(
                     f"Error fetching active player data for appid {appid}: {e}",
                     level="error",
                     verbose=True,
                 )
-            all_data.append(game_record)
+            return game_record, monthly_data
 
-        # sort the months chronologically
-        sorted_months = sorted(all_months)
-
-        # create a dataframe with all months as columns
-        df = pd.DataFrame(
-            all_data,
-            columns=["steam_appid", "name", "peak_active_player_all_time"] + sorted_months,
+        fetched = dict(
+            zip(
+                unique_appids,
+                self._map_concurrently(_fetch_one, enumerate(unique_appids, start=1)),
+            )
         )
-
-        # fill NaN values with the specified value
-        df.fillna(fill_na_as, inplace=True)
+        results = [fetched[appid] for appid in steam_appids]
+
+        # fill a pre-filled (games x months) array directly, months sorted chronologically
+        months = sorted(set().union(*(monthly_data for _, monthly_data in results)))
+        month_idx = {month: idx for idx, month in enumerate(months)}
+        monthly_values = np.full((len(results), len(months)), fill_na_as, dtype="float64")
+        for row, (_, monthly_data) in enumerate(results):
+            for month, value in monthly_data.items():
+                if value is not None:
+                    monthly_values[row, month_idx[month]] = value
+
+        df = pd.DataFrame(monthly_values, columns=months)
+        # the record columns are filled while collected, so no fillna pass over the frame
+        for position, column in enumerate(("steam_appid", "name", "peak_active_player_all_time")):
+            df.insert(
+                position,
+                column,
+                [
+                    fill_na_as if game_record[column] is None else game_record[column]
+                    for game_record, _ in results
+                ],
+            )
 
         return df
 
     def get_game_review(
         self, steam_appid: str, verbose: bool = True, review_only: bool = True
     ) -> pd.DataFrame:
+        import pandas as pd
 
         if not steam_appid:
             raise ValueError("steam_appid must be a non-empty.")
@@ -401,43 +615,117 @@ class Collector:
             )
         return pd.DataFrame([])
 
+    def _map_concurrently(self, func: Callable[[_T], _R], items: Iterable[_T]) -> list[_R]:
+        """Apply func to every item using a thread pool, preserving the input order.
+        Args:
+            func (Callable): The function to apply, expected to handle its own errors.
+            items (Iterable): The items to process.
+
+        Returns:
+            list: The results in the same order as items.
+        """
+        return list(self._iter_concurrently(func, items))
+
+    def _iter_concurrently(self, func: Callable[[_T], _R], items: Iterable[_T]) -> Iterator[_R]:
+        """Lazily apply func to every item using a thread pool, yielding in the input order.
+
+        Every item is submitted upfront, results are yielded as soon as they (and the ones
+        before them) are done. Pending items are cancelled if the iterator is closed early.
+        """
+        item_list = list(items)
+        workers = max(1, min(self.max_workers, self.calls, len(item_list)))
+        if workers == 1:
+            yield from map(func, item_list)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            yield from executor.map(func, item_list)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     @logged_rate_limited()
-    def _fetch_raw_data(self, steam_appid: str, verbose: bool = True) -> "GameDataModel":
+    def _fetch_user_data(
+        self, steamid: str, include_free_games: bool = True, verbose: bool = True
+    ) -> SourceResult:
+        """Fetch a single user's data, paced by the collector's rate limit."""
+        result: SourceResult = self.steamuser.fetch(
+            steamid=steamid, include_free_games=include_free_games, verbose=verbose
+        )
+        return result
+
+    def _fetch_raw_data(
+        self, steam_appid: str, verbose: bool = True, now: datetime | None = None
+    ) -> "GameDataModel":
         """Fetch game data from all sources based on appid.
         Args:
             steam_appid (str): The appid of the game to fetch data for.
             verbose (bool: If True, will log the fetching process
+            now (datetime | None): Reference time for days_since_release, shared by a batch.
 
         Returns:
             dict: The combined game data from all sources.
         """
         identifier = str(steam_appid)
+        cached = self._games_cache.get(identifier)
+        if cached is not None:
+            return cached
+
         raw_data: dict[str, Any] = {"steam_appid": identifier}
 
-        for config in self.id_based_sources:
-            source_data = self._fetch_with_observability(
+        id_sources = self._id_based_sources
+        name_sources = self._name_based_sources
+
+        def _fetch(
+            config: SourceConfig, source_identifier: str, scope: Literal["id", "name"]
+        ) -> SourceResult:
+            return self._fetch_with_observability(
                 config.source,
-                identifier=identifier,
-                scope="id",
+                identifier=source_identifier,
+                scope=scope,
                 verbose=verbose,
             )
-            if source_data["success"]:
-                raw_data.update({key: source_data["data"][key] for key in config.fields})
-
-        # if the game name doesn't exist, then the game is not available
-        game_name = raw_data.get("name", None)
-        if game_name:
-            for config in self.name_based_sources:
-                source_data = self._fetch_with_observability(
-                    config.source,
-                    identifier=game_name,
-                    scope="name",
-                    verbose=verbose,
-                )
-                if source_data["success"]:
-                    raw_data.update({key: source_data["data"][key] for key in config.fields})
 
-        return GameDataModel(**raw_data)
+        # id-based sources are independent of each other, so fetch them concurrently. the
+        # name-based ones are submitted as soon as the source providing the name is done,
+        # while the rest of the id-based sources are still in flight
+        with ThreadPoolExecutor(max_workers=len(id_sources) + len(name_sources)) as executor:
+            id_futures = [
+                executor.submit(_fetch, config, identifier, "id") for config in id_sources
+            ]
+
+            name_futures = []
+            # if the game name doesn't exist, then the game is not available
+            game_name = self._extract_game_name(id_futures)
+            if game_name:
+                name_futures = [
+                    executor.submit(_fetch, config, game_name, "name") for config in name_sources
+                ]
+
+            # merge in the configured order so overlapping fields resolve the same way every time
+            for config, future in zip(
+                (*id_sources, *name_sources[: len(name_futures)]), (*id_futures, *name_futures)
+            ):
+                source_data = future.result()
+                # nothing to merge from failed or empty results
+                if source_data["success"] and source_data["data"]:
+                    raw_data.update(config.extract(source_data["data"]))
+
+        game_data = GameDataModel.model_validate(raw_data, context={"now": now})
+        # only keep found games, a missing name might be a transient failure
+        if game_data.name:
+            self._games_cache.set(identifier, game_data)
+        return game_data
+
+    def _extract_game_name(self, id_futures: list[Future[SourceResult]]) -> str | None:
+        """Wait for the id-based source providing the game name and return the name (if any)."""
+        for config, future in zip(self._id_based_sources, id_futures):
+            if "name" in config.fields:
+                source_data = future.result()
+                if source_data["success"]:
+                    name: str | None = source_data["data"].get("name")
+                    return name
+        return None
 
     def _fetch_with_observability(
         self,
@@ -462,7 +750,8 @@ class Collector:
             ) as timing:
                 result = source.fetch(identifier, verbose=verbose)
         except Exception as exc:
-            metrics.counter("source_fetch_exception_total", source=source_name, scope=scope)
+            if metrics.enabled:
+                metrics.counter("source_fetch_exception_total", source=source_name, scope=scope)
             source.logger.log_event(
                 "source_fetch_exception",
                 level="error",
@@ -474,11 +763,12 @@ class Collector:
             raise
 
         duration_ms = round(timing.duration * 1000, 2)
-        metrics.counter("source_fetch_total", source=source_name, scope=scope)
-        if result["success"]:
-            metrics.counter("source_fetch_success_total", source=source_name, scope=scope)
-        else:
-            metrics.counter("source_fetch_error_total", source=source_name, scope=scope)
+        if metrics.enabled:
+            metrics.counter("source_fetch_total", source=source_name, scope=scope)
+            if result["success"]:
+                metrics.counter("source_fetch_success_total", source=source_name, scope=scope)
+            else:
+                metrics.counter("source_fetch_error_total", source=source_name, scope=scope)
 
         source.logger.log_event(
             "source_fetch_complete",
@@ -1,9 +1,186 @@
+from collections.abc import Callable
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, ValidationInfo, model_validator
 from typing_extensions import Self
 
+_MONTHS = {
+    month: idx
+    for idx, month in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"),
+        start=1,
+    )
+}
+
+
+# fields kept by GameDataModel.get_recap, in output order
+_RECAP_FIELDS: tuple[str, ...] = (
+    "steam_appid",
+    "name",
+    "developers",
+    "publishers",
+    "type",
+    "release_date",
+    "days_since_release",
+    "price_currency",
+    "price_initial",
+    "price_final",
+    "copies_sold",
+    "estimated_revenue",
+    "owners",
+    "total_positive",
+    "total_negative",
+    "total_reviews",
+    "comp_main",
+    "comp_plus",
+    "comp_100",
+    "comp_all",
+    "invested_co",
+    "invested_mp",
+    "average_playtime",
+    "active_player_24h",
+    "peak_active_player_all_time",
+    "achievements_count",
+    "achievements_percentage_average",
+    "categories",
+    "genres",
+    "tags",
+)
+_RECAP_GETTER = attrgetter(*_RECAP_FIELDS)
+
+
+@lru_cache(maxsize=4096)
+def _parse_release_date(value: str) -> datetime | None:
+    """Parse '%b %d, %Y' (e.g. 'Jun 15, 2023') without going through strptime.
+
+    Many games share a release date, so the results are cached.
+    """
+    try:
+        month, day, year = value.split()
+        if day.endswith(",") and len(year) == 4:
+            return datetime(int(year), _MONTHS[month.lower()], int(day[:-1]))
+    except (KeyError, ValueError):
+        pass
+
+    # anything unusual is left to strptime
+    try:
+        return datetime.strptime(value, "%b %d, %Y")
+    except ValueError:
+        return None
+
+
+def _to_release_date(v: str | int | float | datetime | None) -> datetime | None:
+    """Parse dates in format '%b %d, %Y' (e.g. 'Jun 15, 2023')"""
+    if v is None or isinstance(v, datetime):
+        return v
+    try:
+        if isinstance(v, str):
+            return _parse_release_date(v)
+        elif isinstance(v, (int, float)):
+            return datetime.fromtimestamp(v)
+    except (ValueError, TypeError):
+        pass
+    return None
+
+
+def _to_int(v: str | int | float | None) -> int | None:
+    """convert x types to int"""
+    if v is None:
+        return None
+    try:
+        return int(v)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_float(v: str | int | float | None) -> float:
+    """convert x types to float or float("nan")"""
+    if v is None:
+        return float("nan")
+    try:
+        return float(v)
+    except (ValueError, TypeError):
+        return float("nan")
+
+
+def _to_str(v: str | None) -> str:
+    """convert x types to string"""
+    return "" if v is None else str(v)
+
+
+def _to_list(v: list[Any] | str | int | None) -> list[Any]:
+    """ensure the fields are always lists (convert single values/none to lists)"""
+    if v is None:
+        return []
+    return v if isinstance(v, list) else [v]
+
+
+_INT_FIELDS = frozenset(
+    {
+        "metacritic_score",
+        "copies_sold",
+        "estimated_revenue",
+        # "total_revenue",
+        "owners",
+        "ccu",
+        "active_player_24h",
+        "peak_active_player_all_time",
+        "review_score",
+        "total_positive",
+        "total_negative",
+        "total_reviews",
+        "achievements_count",
+        "comp_main",
+        "comp_plus",
+        "comp_100",
+        "comp_all",
+        "comp_main_count",
+        "comp_plus_count",
+        "comp_100_count",
+        "comp_all_count",
+        "invested_co",
+        "invested_mp",
+        "invested_co_count",
+        "invested_mp_count",
+        "count_comp",
+        "count_speed_run",
+        "count_backlog",
+        "count_review",
+        "count_playing",
+        "count_retired",
+    }
+)
+_FLOAT_FIELDS = frozenset(
+    {"price_initial", "price_final", "average_playtime_h", "achievements_percentage_average"}
+)
+_STR_FIELDS = frozenset({"steam_appid", "name", "type"})
+_LIST_FIELDS = frozenset(
+    {
+        "developers",
+        "publishers",
+        "platforms",
+        "categories",
+        "genres",
+        "tags",
+        "languages",
+        "content_rating",
+        "monthly_active_player",
+        "achievements_list",
+    }
+)
+
+# field -> coercion applied to its raw value before validation, one lookup per given field
+_FIELD_COERCERS: dict[str, Callable[[Any], Any]] = {
+    "release_date": _to_release_date,
+    **dict.fromkeys(_INT_FIELDS, _to_int),
+    **dict.fromkeys(_FLOAT_FIELDS, _to_float),
+    **dict.fromkeys(_STR_FIELDS, _to_str),
+    **dict.fromkeys(_LIST_FIELDS, _to_list),
+}
+
 
 class GameDataModel(BaseModel):
     """Complete game data model with Python 3.10+ type hints and Pydantic v2 validation"""
@@ -65,111 +242,32 @@ class GameDataModel(BaseModel):
     tags: list[str] = Field(default_factory=list)
     content_rating: list[dict[str, Any]] = Field(default_factory=list)
 
-    @field_validator("release_date", mode="before")
-    def parse_release_date(cls, v: str | int | float | datetime | None) -> datetime | None:
-        """Parse dates in format '%b %d, %Y' (e.g. 'Jun 15, 2023')"""
-        if v is None or isinstance(v, datetime):
-            return v
-        try:
-            if isinstance(v, str):
-                return datetime.strptime(v, "%b %d, %Y")
-            elif isinstance(v, (int, float)):
-                return datetime.fromtimestamp(v)
-        except (ValueError, TypeError):
-            return None
-
-    @field_validator(
-        "metacritic_score",
-        "copies_sold",
-        "estimated_revenue",
-        # "total_revenue",
-        "owners",
-        "ccu",
-        "active_player_24h",
-        "peak_active_player_all_time",
-        "review_score",
-        "total_positive",
-        "total_negative",
-        "total_reviews",
-        "achievements_count",
-        "comp_main",
-        "comp_plus",
-        "comp_100",
-        "comp_all",
-        "comp_main_count",
-        "comp_plus_count",
-        "comp_100_count",
-        "comp_all_count",
-        "invested_co",
-        "invested_mp",
-        "invested_co_count",
-        "invested_mp_count",
-        "count_comp",
-        "count_speed_run",
-        "count_backlog",
-        "count_review",
-        "count_playing",
-        "count_retired",
-        mode="before",
-    )
-    def handle_integers(cls, v: str | int | float | None) -> int | None:
-        """convert x types to int"""
-        if v is None:
-            return None
-        try:
-            return int(v)
-        except (ValueError, TypeError):
-            return None
-
-    @field_validator(
-        "price_initial",
-        "price_final",
-        "average_playtime_h",
-        "achievements_percentage_average",
-        mode="before",
-    )
-    def handle_float(cls, v: str | int | float | None) -> float:
-        """convert x types to float or float("nan")"""
-        if v is None:
-            return float("nan")
-        try:
-            return float(v)
-        except (ValueError, TypeError):
-            return float("nan")
-
-    @field_validator("steam_appid", "name", "type", mode="before")
-    def ensure_string(cls, v: str | None) -> str:
-        """convert x types to string"""
-        return "" if v is None else str(v)
-
-    @field_validator(
-        "developers",
-        "publishers",
-        "platforms",
-        "categories",
-        "genres",
-        "tags",
-        "languages",
-        "content_rating",
-        "monthly_active_player",
-        "achievements_list",
-        mode="before",
-    )
-    def ensure_list(cls, v: list[Any] | str | int | None) -> list[Any]:
-        """ensure the fields are always lists (convert single values/none to lists)"""
-        if v is None:
-            return []
-        return v if isinstance(v, list) else [v]
+    @model_validator(mode="before")
+    @classmethod
+    def coerce_fields(cls, data: Any) -> Any:
+        """Coerce the raw values to the fields' types in a single pass over the given data"""
+        if not isinstance(data, dict):
+            return data
+        get_coercer = _FIELD_COERCERS.get
+        return {
+            key: coerce(value) if (coerce := get_coercer(key)) else value
+            for key, value in data.items()
+        }
 
     def get_recap(self) -> dict[str, Any]:
         """Create a reduced model with only recap fields"""
-        recap_data = {field: getattr(self, field) for field in self._RECAP_FIELDS}
+        # copy the lists, so changing a recap can't reach back into the (possibly cached) model
+        recap_data = {
+            field: value.copy() if isinstance(value, list) else value
+            for field, value in zip(_RECAP_FIELDS, _RECAP_GETTER(self))
+        }
         return recap_data
 
     @model_validator(mode="after")
-    def preprocess_data(self) -> Self:
+    def preprocess_data(self, info: ValidationInfo) -> Self:
         self.compute_average_playtime()
-        self.compute_days_since_release()
+        # a batch passes its start time (context={"now": ...}) so its games share the same "today"
+        self.compute_days_since_release(info.context.get("now") if info.context else None)
         return self
 
     def compute_average_playtime(self) -> None:
@@ -179,39 +277,8 @@ class GameDataModel(BaseModel):
         ):
             self.average_playtime = int(self.average_playtime_h * 3600)
 
-    def compute_days_since_release(self) -> None:
+    def compute_days_since_release(self, now: datetime | None = None) -> None:
         if self.release_date:
-            self.days_since_release = (datetime.now() - self.release_date).days
+            self.days_since_release = ((now or datetime.now()) - self.release_date).days
 
-    _RECAP_FIELDS = {
-        "steam_appid",
-        "name",
-        "developers",
-        "publishers",
-        "type",
-        "release_date",
-        "days_since_release",
-        "price_currency",
-        "price_initial",
-        "price_final",
-        "copies_sold",
-        "estimated_revenue",
-        "owners",
-        "total_positive",
-        "total_negative",
-        "total_reviews",
-        "comp_main",
-        "comp_plus",
-        "comp_100",
-        "comp_all",
-        "invested_co",
-        "invested_mp",
-        "average_playtime",
-        "active_player_24h",
-        "peak_active_player_all_time",
-        "achievements_count",
-        "achievements_percentage_average",
-        "categories",
-        "genres",
-        "tags",
-    }
+    _RECAP_FIELDS: ClassVar[tuple[str, ...]] = _RECAP_FIELDS
@@ -1,10 +1,16 @@
+import random
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any, Literal, TypedDict
 from urllib.parse import urljoin
 
 import requests
 from fake_useragent import UserAgent
+from requests.adapters import HTTPAdapter
 from requests.exceptions import (
     ConnectionError,
     InvalidURL,
@@ -32,18 +38,129 @@ SourceResult = SuccessResult | ErrorResult
 # a custom error code for the synthetic response
 SYNTHETIC_ERROR_CODE = 599
 
+# request errors worth retrying, and the ones that won't be fixed by retrying
+_EXCEPTIONS_TO_RETRY = (ConnectionError, Timeout)
+_EXCEPTIONS_TO_ABORT = (InvalidURL, SSLError, TooManyRedirects)
+
+# responses worth retrying (rate limited or a temporarily unavailable upstream)
+_STATUS_TO_RETRY = frozenset({429, 502, 503, 504})
+# upper bound (in seconds) for a single server-requested or backoff wait
+_MAX_RETRY_DELAY = 60.0
+
+# connection pool sizing for each source's session (pool_maxsize covers the collector's workers)
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 16
+
+# number of user-agent strings pre-generated from fake_useragent
+_USER_AGENT_POOL_SIZE = 64
+# used only when fake_useragent fails to load its data
+_FALLBACK_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/126.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) "
+    "Version/17.5 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64; rv:127.0) Gecko/20100101 Firefox/127.0",
+)
+
+
+@lru_cache(maxsize=1)
+def _user_agent_pool() -> tuple[str, ...]:
+    """Build the user-agent pool once, instead of loading fake_useragent data on every request."""
+    try:
+        ua = UserAgent()
+        return tuple(ua.random for _ in range(_USER_AGENT_POOL_SIZE))
+    except Exception:
+        return _FALLBACK_USER_AGENTS
+
+
+def random_user_agent() -> str:
+    """Get a random user-agent string from the cached pool."""
+    return random.choice(_user_agent_pool())
+
+
+@lru_cache(maxsize=4096)
+def _build_url(base_url: str, endpoint: str | None = None) -> str:
+    """Join the base URL and endpoint once per pair, instead of re-parsing them on every request."""
+    final_url = base_url.rstrip("/")
+    if endpoint:
+        final_url = urljoin(final_url + "/", endpoint.rstrip("/"))
+    return final_url
+
+
+def _quota_reset_delay(response: requests.Response) -> float | None:
+    """Seconds until an exhausted X-RateLimit quota resets, None if the quota isn't used up."""
+    if response.headers.get("X-RateLimit-Remaining") != "0":
+        return None
+    try:
+        return float(response.headers["X-RateLimit-Reset"]) - time.time()
+    except (KeyError, ValueError):
+        return None
+
+
+def _retry_delay(response: requests.Response, backoff_factor: float, attempts: int) -> float:
+    """Seconds to wait before retrying a rate limited / unavailable response.
+
+    Follows the server's Retry-After (or an exhausted X-RateLimit-Reset) when present, otherwise
+    backs off exponentially with a bit of jitter so concurrent workers don't retry in lockstep.
+    """
+    delay: float | None = None
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = None
+    else:
+        delay = _quota_reset_delay(response)
+
+    if delay is None:
+        delay = backoff_factor * (2 ** (attempts - 1)) + random.uniform(0, backoff_factor)
+    return min(max(delay, 0.0), _MAX_RETRY_DELAY)
+
 
 class BaseSource(ABC):
     _base_url: str | None = None
+    # (calls, period) overriding the source's default fetch budget, set it before the first fetch
+    rate_limit: tuple[int, int] | None = None
+    # epoch time before which requests wait, set when a response reports an exhausted quota
+    _quota_resume_at: float = 0.0
 
     def __init__(self) -> None:
         """Initialize the base class for all its children."""
         self._logger = LoggerWrapper(self.__class__.__name__)
+        self._name = self.__class__.__name__.lower()
+        self._session = self._build_session()
 
     @property
     def logger(self) -> "LoggerWrapper":
         return self._logger
 
+    @property
+    def name(self) -> str:
+        """Get the source's name (lowercased class name, e.g. 'steamstore')."""
+        return self._name
+
+    @property
+    def session(self) -> requests.Session:
+        """Get the persistent session used for the source's requests."""
+        return self._session
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Create a session with pooled keep-alive connections."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close the source's session and release its pooled connections."""
+        self._session.close()
+
     @property
     @abstractmethod
     def _valid_labels(self) -> tuple[str, ...]:
@@ -77,6 +194,41 @@ class BaseSource(ABC):
         """
         pass
 
+    def fetch_many(
+        self,
+        steam_appids: Iterable[str],
+        verbose: bool = True,
+        selected_labels: list[str] | None = None,
+        max_workers: int = 8,
+    ) -> dict[str, SourceResult]:
+        """Fetch data for several appids (or game names / steamids, depending on the source) concurrently.
+        Args:
+            steam_appids (Iterable[str]): The identifiers to fetch data for, as taken by the source's fetch.
+            verbose (bool): If True, will log the fetching process.
+            selected_labels (list[str] | None): A list of labels to filter the data. If None, all labels will be used.
+            max_workers (int): Max number of requests in flight at once.
+
+        Returns:
+            dict[str, SourceResult]: The result of each (deduplicated) identifier, in input order.
+
+        Behavior:
+            - Every call still goes through fetch's rate limiter, so the source's budget is shared.
+            - None of the sources' detail endpoints return several games per request, hence one fetch per identifier.
+        """
+        identifiers = list(dict.fromkeys(str(identifier) for identifier in steam_appids))
+        if not identifiers:
+            return {}
+
+        def _fetch_one(identifier: str) -> SourceResult:
+            result: SourceResult = self.fetch(
+                identifier, verbose=verbose, selected_labels=selected_labels
+            )
+            return result
+
+        workers = max(1, min(max_workers, len(identifiers)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(identifiers, executor.map(_fetch_one, identifiers)))
+
     def _make_request(
         self,
         url: str | None = None,
@@ -93,35 +245,39 @@ class BaseSource(ABC):
             endpoint (str): Optional path to append to base URL (e.g., steam_appid)
             headers (dict | None): Optional headers dictionary
             params (dict | None): Optional query parameters dictionary
-            retries (int): Max number of retries
+            retries (int): Max number of attempts, the first request included
             backoff_factor (float): Multiplier for sleep/cooldown between retries
         Return:
             requests.Response: The response of the request call.
         """
         source_url = url if url else self._base_url
-        final_url = source_url.rstrip("/")  # type: ignore[union-attr]
-        if endpoint:
-            final_url = urljoin(final_url + "/", endpoint.rstrip("/"))
+        final_url = _build_url(source_url, endpoint)
 
-        # add user-agent in params
-        ua = UserAgent()
-        params_ua = {"User-Agent": ua.random}
-        if params is None:
-            params = params_ua
-        else:
-            params.update(params_ua)
-
-        exception_to_retry = (ConnectionError, Timeout)
-        exception_to_abort = (
-            InvalidURL,
-            SSLError,
-            TooManyRedirects,
-        )
+        # add user-agent in params (without mutating the caller's dict)
+        request_params = {**(params or {}), "User-Agent": random_user_agent()}
 
-        for attempts in range(1, retries + 2):
+        self._wait_for_quota_reset()
+
+        for attempts in range(1, retries + 1):
             try:
-                return requests.get(final_url, headers=headers, params=params, timeout=timeout)
-            except exception_to_retry as e:
+                response = self._session.get(
+                    final_url, headers=headers, params=request_params, timeout=timeout
+                )
+                if response.status_code in _STATUS_TO_RETRY and attempts < retries:
+                    sleep_duration = _retry_delay(response, backoff_factor, attempts)
+                    self.logger.log(
+                        f"Received status {response.status_code}. Retrying in {sleep_duration: .1f}s. (Attempt {attempts+1} of {retries})",
+                        level="warning",
+                        verbose=True,
+                    )
+                    time.sleep(sleep_duration)
+                    continue
+                quota_delay = _quota_reset_delay(response)
+                if quota_delay is not None and quota_delay > 0:
+                    # the quota is used up, hold the next request until it resets
+                    self._quota_resume_at = time.time() + min(quota_delay, _MAX_RETRY_DELAY)
+                return response
+            except _EXCEPTIONS_TO_RETRY as e:
                 if attempts < retries:
                     sleep_duration = backoff_factor * (2 ** (attempts - 1))  # the cooldown period
                     self.logger.log(
@@ -133,7 +289,7 @@ class BaseSource(ABC):
                     continue
                 else:
                     return self._create_synthetic_response(url=final_url, reason=str(e))
-            except exception_to_abort as e:
+            except _EXCEPTIONS_TO_ABORT as e:
                 self.logger.log(
                     f"Encounter fatal error {e}. Abort process..",
                     level="error",
@@ -150,6 +306,17 @@ class BaseSource(ABC):
 
         return self._create_synthetic_response(url=final_url, reason="unexpected request error")
 
+    def _wait_for_quota_reset(self) -> None:
+        """Sleep until the quota reported exhausted by an earlier response resets."""
+        wait = self._quota_resume_at - time.time()
+        if wait > 0:
+            self.logger.log(
+                f"Rate limit quota exhausted. Waiting {wait: .1f}s for it to reset.",
+                level="warning",
+                verbose=True,
+            )
+            time.sleep(wait)
+
     def _create_synthetic_response(self, url: str, reason: str) -> requests.Response:
         """create a synthetic response to return"""
         response = requests.Response()
@@ -181,22 +348,54 @@ class BaseSource(ABC):
             frozenset(valid_labels) if valid_labels is not None else self._valid_labels_set
         )
 
-        valid: list[str] = []
-        invalid: list[str] = []
-        for label in selected_labels:
-            (valid if label in validation_set else invalid).append(label)
+        # fast path, the selected labels are usually all valid
+        if validation_set.issuperset(selected_labels):
+            return list(selected_labels)
 
-        # log the invalid labels if any
-        if invalid:
-            reference_labels = valid_labels if valid_labels is not None else self._valid_labels
-            self.logger.log(
-                f"Ignoring the following invalid labels: {invalid}, valid labels are: {reference_labels}",
-                level="warning",
-                verbose=True,
-            )
+        valid = [label for label in selected_labels if label in validation_set]
+        invalid = [label for label in selected_labels if label not in validation_set]
+
+        # log the invalid labels
+        reference_labels = valid_labels if valid_labels is not None else self._valid_labels
+        self.logger.log(
+            f"Ignoring the following invalid labels: {invalid}, valid labels are: {reference_labels}",
+            level="warning",
+            verbose=True,
+        )
 
         return valid
 
+    def _select_labels(
+        self,
+        data: dict[str, Any],
+        selected_labels: list[str],
+        valid_labels: list[str] | tuple[str, ...] | None = None,
+    ) -> dict[str, Any]:
+        """Pick the selected labels out of the data, invalid labels are ignored (and logged).
+
+        Args:
+            data (dict[str, Any]): The transformed data to pick the labels from.
+            selected_labels (list[str]): A list of labels to keep.
+            valid_labels (list[str] | tuple[str, ...] | None): Valid labels to compare with. If None, uses the class's valid labels.
+        Returns:
+            dict[str, Any]: The data restricted to the valid selected labels, in the selected order.
+        """
+        validation_set = (
+            frozenset(valid_labels) if valid_labels is not None else self._valid_labels_set
+        )
+        if validation_set.issuperset(selected_labels):
+            # all labels selected in the data's own order (a common convenience), nothing to drop
+            if len(selected_labels) == len(data) and tuple(selected_labels) == tuple(data):
+                return data
+            return {label: data[label] for label in selected_labels}
+
+        return {
+            label: data[label]
+            for label in self._filter_valid_labels(
+                selected_labels=selected_labels, valid_labels=valid_labels
+            )
+        }
+
     def _build_error_result(self, error_message: str, verbose: bool = True) -> ErrorResult:
         """Error message/returns handler.
         Args:
@@ -1,6 +1,7 @@
 from typing import Any
 
 from gameinsights.sources.base import BaseSource, SourceResult, SuccessResult
+from gameinsights.utils import serialization
 from gameinsights.utils.ratelimit import logged_rate_limited
 
 _GAMALYTICS_LABELS = (
@@ -95,12 +96,10 @@ class Gamalytic(BaseSource):
             )
 
         # Parse JSON repsonse if everything is fine and pack/process the data as labels we want
-        data_packed = self._transform_data(data=response.json())
+        data_packed = self._transform_data(data=serialization.loads(response.content))
 
         if selected_labels:
-            data_packed = {
-                label: data_packed[label] for label in self._filter_valid_labels(selected_labels)
-            }
+            data_packed = self._select_labels(data_packed, selected_labels)
 
         return SuccessResult(success=True, data=data_packed)
 
@@ -3,16 +3,23 @@
 # But modified to fit this project, all credit goes to the original author
 # ---------------------------
 
-import json
 import re
-from typing import Any, cast
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, ClassVar, cast
 
 import requests
-from bs4 import BeautifulSoup
-from bs4.element import Tag
-from fake_useragent import UserAgent
 
-from gameinsights.sources.base import BaseSource, SourceResult, SuccessResult
+from gameinsights.sources.base import (
+    BaseSource,
+    SourceResult,
+    SuccessResult,
+    random_user_agent,
+)
+from gameinsights.utils import serialization
 from gameinsights.utils.ratelimit import logged_rate_limited
 
 _HOWLONGTOBEAT_LABELS = (
@@ -39,15 +46,58 @@ _HOWLONGTOBEAT_LABELS = (
     "count_playing",
     "count_retired",
 )
+_HOWLONGTOBEAT_GETTER = itemgetter(*_HOWLONGTOBEAT_LABELS)
+
+# static part of the search payload, built once and never mutated
+_SEARCH_OPTIONS: dict[str, Any] = {
+    "games": {
+        "userId": 0,
+        "platform": "",
+        "sortCategory": "popular",
+        "rangeCategory": "main",
+        "rangeTime": {"min": 0, "max": 0},
+        "gameplay": {"perspective": "", "flow": "", "genre": "", "difficulty": ""},
+        "rangeYear": {"max": "", "min": ""},
+        "modifier": "",
+    },
+    "users": {"sortCategory": "postcount"},
+    "lists": {"sortCategory": "follows"},
+    "filter": "",
+    "sort": 0,
+    "randomizer": 0,
+}
+
+# max concurrent downloads when scanning the HLTB scripts
+_SCRIPT_FETCH_WORKERS = 8
+
+# patterns used to extract the search api key & url from the HLTB scripts
+_API_KEY_PATTERN = re.compile(r'users\s*:\s*{\s*id\s*:\s*"([^"]+)"')
+_CONCAT_API_KEY_PATTERN = re.compile(r'\/api\/\w+\/"(?:\.concat\("[^"]*"\))*')
+_CONCAT_CLEANUP_PATTERN = re.compile(r'["\(\)\[\]\']')
+_SEARCH_URL_PATTERN = re.compile(
+    r'fetch\(\s*["\'](\/api\/[^"\']*)["\']'  # Matches the endpoint
+    r'((?:\s*\.concat\(\s*["\']([^"\']*)["\']\s*\))+)'  # Captures concatenated strings
+    r"\s*,",  # Matches up to the comma
+    re.DOTALL,
+)
+_SCRIPT_SRC_PATTERN = re.compile(r'<script[^>]+?src\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+_CONCAT_STRING_PATTERN = re.compile(r'\.concat\(\s*["\']([^"\']*)["\']\s*\)')
 
 
 class SearchInformation:
     """Class to hold search information extracted from the HLTB script."""
 
-    def __init__(self, title_headers: dict[str, Any]) -> None:
+    def __init__(
+        self, title_headers: dict[str, Any], session: requests.Session | None = None
+    ) -> None:
         self.api_key: str | None = None
         self.search_url: str | None = None
-        self._get_search_informations(title_headers=title_headers)
+        if session is None:
+            # the homepage and its scripts share a host, keep the connection alive between them
+            with requests.Session() as own_session:
+                self._get_search_informations(title_headers=title_headers, session=own_session)
+        else:
+            self._get_search_informations(title_headers=title_headers, session=session)
         if self.search_url:
             self.search_url = self.search_url.lstrip("/")
 
@@ -59,19 +109,17 @@ class SearchInformation:
             str | None: The extracted API key if found, otherwise None.
         """
 
-        api_key_pattern = r'users\s*:\s*{\s*id\s*:\s*"([^"]+)"'
-        matches = re.findall(api_key_pattern, script_content)
+        matches = _API_KEY_PATTERN.findall(script_content)
 
         if matches:
             key = "".join(matches)
             return key
 
-        concat_api_key_pattern = r'\/api\/\w+\/"(?:\.concat\("[^"]*"\))*'
-        matches = re.findall(concat_api_key_pattern, script_content)
+        matches = _CONCAT_API_KEY_PATTERN.findall(script_content)
 
         if matches:
             matches = str(matches).split(".concat")
-            matches = [re.sub(r'["\(\)\[\]\']', "", match) for match in matches[1:]]
+            matches = [_CONCAT_CLEANUP_PATTERN.sub("", match) for match in matches[1:]]
             key = "".join(matches)
             return key
 
@@ -84,18 +132,12 @@ class SearchInformation:
         Returns:
             str | None: The extracted search URL if found, otherwise None.
         """
-        pattern = re.compile(
-            r'fetch\(\s*["\'](\/api\/[^"\']*)["\']'  # Matches the endpoint
-            r'((?:\s*\.concat\(\s*["\']([^"\']*)["\']\s*\))+)'  # Captures concatenated strings
-            r"\s*,",  # Matches up to the comma
-            re.DOTALL,
-        )
-        matches = pattern.finditer(script_content)
+        matches = _SEARCH_URL_PATTERN.finditer(script_content)
         for match in matches:
             endpoint = match.group(1)
             concat_calls = match.group(2)
             # Extract all concatenated strings
-            concat_strings = re.findall(r'\.concat\(\s*["\']([^"\']*)["\']\s*\)', concat_calls)
+            concat_strings = _CONCAT_STRING_PATTERN.findall(concat_calls)
             concatenated_str = "".join(concat_strings)
             # Check if the concatenated string matches the known string
             if concatenated_str == self.api_key:
@@ -103,47 +145,75 @@ class SearchInformation:
         # Unable to find :(
         return None
 
-    def _get_search_informations(self, title_headers: dict[str, Any]) -> None:
-        response = requests.get(HowLongToBeat.BASE_URL, headers=title_headers, timeout=60)
+    def _get_search_informations(
+        self, title_headers: dict[str, Any], session: requests.Session
+    ) -> None:
+        response = session.get(HowLongToBeat.BASE_URL, headers=title_headers, timeout=60)
 
         if response.status_code == 200 and response.text:
-            soup = BeautifulSoup(response.text, "html.parser")
-            scripts = soup.find_all("script", src=True)
-
-            matching_scripts: list[str] = []
-            non_matching_scripts: list[str] = []
-
-            for script in scripts:
-                if not isinstance(script, Tag):
-                    continue
-
-                src_attr = script.get("src")
-                if isinstance(src_attr, str):
-                    if "_app-" in src_attr:
-                        matching_scripts.append(src_attr)
-                    else:
-                        non_matching_scripts.append(src_attr)
-
-            # look for scripts that provide the api key
-            self._process_script(matching_scripts, title_headers=title_headers)
+            # only the script tags' src are needed, so scan for them instead of parsing the page
+            script_urls = _SCRIPT_SRC_PATTERN.findall(response.text)
+            matching_scripts = [src for src in script_urls if "_app-" in src]
+            non_matching_scripts = [src for src in script_urls if "_app-" not in src]
 
+            # look for scripts that provide the api key,
             # if we still don't have the api key, try to get it from the other scripts
-            if self.api_key is None:
-                self._process_script(non_matching_scripts, title_headers=title_headers)
-
-    def _process_script(self, script_urls: list[str], title_headers: dict[str, Any]) -> None:
+            if not self._process_script(
+                matching_scripts, title_headers=title_headers, session=session
+            ):
+                self._process_script(
+                    non_matching_scripts, title_headers=title_headers, session=session
+                )
+
+    def _process_script(
+        self, script_urls: list[str], title_headers: dict[str, Any], session: requests.Session
+    ) -> bool:
         """Process the script content to extract API key and search URL.
         Args:
             script_urls (list[str]): List of script URLs to process.
+            title_headers (dict[str, Any]): Headers for the script requests.
+            session (requests.Session): Session used for the script requests.
+
+        Returns:
+            bool: True if the API key was found, the remaining scripts are not processed.
         """
-        for script_url in script_urls:
-            script_url = HowLongToBeat.BASE_URL + script_url
-            script_response = requests.get(script_url, headers=title_headers, timeout=60)
-            if script_response.status_code == 200 and script_response.text:
-                self.api_key = self._extract_api_from_script(script_response.text)
-                self.search_url = self._extract_search_url_script(script_response.text)
-                if self.api_key:
-                    break
+        if not script_urls:
+            return False
+
+        def _fetch_script(script_url: str) -> str | None:
+            script_response = session.get(
+                HowLongToBeat.BASE_URL + script_url, headers=title_headers, timeout=60
+            )
+            if script_response.status_code != 200 or not script_response.text:
+                return None
+            return script_response.text
+
+        if len(script_urls) == 1:
+            script_texts: Iterable[str | None] = (_fetch_script(script_urls[0]),)
+            return self._process_script_texts(script_texts)
+
+        executor = ThreadPoolExecutor(max_workers=min(_SCRIPT_FETCH_WORKERS, len(script_urls)))
+        try:
+            # fetched in parallel but handed over in document order, so the first matching script wins
+            return self._process_script_texts(executor.map(_fetch_script, script_urls))
+        finally:
+            # drop the scripts that haven't been fetched yet once the key is found, and let the
+            # running fetches finish before the caller closes the session
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _process_script_texts(self, script_texts: Iterable[str | None]) -> bool:
+        for script_text in script_texts:
+            if not script_text:
+                continue
+
+            api_key = self._extract_api_from_script(script_text)
+            if api_key:
+                # the search url lives in the same script as the api key
+                self.api_key = api_key
+                self.search_url = self._extract_search_url_script(script_text)
+                return True
+
+        return False
 
 
 class HowLongToBeat(BaseSource):
@@ -154,11 +224,44 @@ class HowLongToBeat(BaseSource):
     _valid_labels: tuple[str, ...] = _HOWLONGTOBEAT_LABELS
     _valid_labels_set: frozenset[str] = frozenset(_HOWLONGTOBEAT_LABELS)
 
+    # the search information is shared by all instances and refreshed once it gets older than this
+    SEARCH_INFO_TTL = 60 * 60
+    _search_info_cache: ClassVar[tuple[float, SearchInformation] | None] = None
+    _search_info_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self) -> None:
         """Initialize the HowLongToBeat source."""
+        # the search information is scraped on the first search, so constructing the source
+        # doesn't hit the network
         super().__init__()
-        title_headers = HowLongToBeat._get_title_request_headers()
-        self._search_info_data: SearchInformation = SearchInformation(title_headers=title_headers)
+
+    def _search_information(self) -> SearchInformation:
+        """Get the shared search information, so expired or failed scrapes are retried."""
+        return HowLongToBeat._get_search_information()
+
+    @classmethod
+    def _get_search_information(cls) -> SearchInformation:
+        """Get the cached search information, or scrape it if it is missing or expired.
+
+        Returns:
+            SearchInformation: Search information containing API key and search URL of the HLTB.
+        """
+        with cls._search_info_lock:
+            cached = cls._search_info_cache
+            if cached is not None and time.monotonic() - cached[0] < cls.SEARCH_INFO_TTL:
+                return cached[1]
+
+            search_info = SearchInformation(title_headers=cls._get_title_request_headers())
+            # only cache a successful scrape, so a failed one is retried by the next search
+            if search_info.api_key:
+                cls._search_info_cache = (time.monotonic(), search_info)
+            return search_info
+
+    @classmethod
+    def clear_search_info_cache(cls) -> None:
+        """Drop the cached search information, the next search will scrape it again."""
+        with cls._search_info_lock:
+            cls._search_info_cache = None
 
     @logged_rate_limited(calls=60, period=60)  # web scrape -> 60 requests per minute to be polite
     def fetch(
@@ -190,8 +293,8 @@ class HowLongToBeat(BaseSource):
             return self._build_error_result("Failed to fetch data.", verbose=verbose)
 
         try:
-            search_result_raw = json.loads(search_response.text)
-        except json.JSONDecodeError:
+            search_result_raw = serialization.loads(search_response.content)
+        except serialization.JSONDecodeError:
             return self._build_error_result("Failed to parse search response.", verbose=verbose)
 
         if not isinstance(search_result_raw, dict):
@@ -207,15 +310,17 @@ class HowLongToBeat(BaseSource):
         data_packed = self._transform_data(data=search_result["data"][0])
 
         if selected_labels:
-            data_packed = {
-                label: data_packed[label] for label in self._filter_valid_labels(selected_labels)
-            }
+            data_packed = self._select_labels(data_packed, selected_labels)
 
         return SuccessResult(success=True, data=data_packed)
 
     def _transform_data(self, data: dict[str, Any]) -> dict[str, Any]:
         # repack / process the data if needed
-        return {label: data.get(label, None) for label in self._valid_labels}
+        try:
+            return dict(zip(_HOWLONGTOBEAT_LABELS, _HOWLONGTOBEAT_GETTER(data)))
+        except KeyError:
+            # some labels are missing, fall back to per-label lookup
+            return {label: data.get(label, None) for label in _HOWLONGTOBEAT_LABELS}
 
     def _fetch_search_results(self, game_name: str, page: int = 1) -> requests.Response:
         """Send a web request to HowLongToBeat to fetch game data.
@@ -226,26 +331,23 @@ class HowLongToBeat(BaseSource):
         Returns:
             str: HTML response text if the request is successful.
         """
-        if not hasattr(self, "_search_info_data") or self._search_info_data is None:
-            title_headers = HowLongToBeat._get_title_request_headers()
-            self._search_info_data = SearchInformation(title_headers=title_headers)
-
+        search_info = self._search_information()
         search_headers = HowLongToBeat._get_search_request_headers()
 
         # if the api key is not found, then we cannot proceed
-        if not self._search_info_data.api_key:
+        if not search_info.api_key:
             return self._create_synthetic_response(
                 url=HowLongToBeat.BASE_URL,
                 reason="Missing HowLongToBeat API key.",
             )
 
         search_url = HowLongToBeat.BASE_URL + "api/s/"
-        if self._search_info_data.search_url:
-            search_url = HowLongToBeat.BASE_URL + self._search_info_data.search_url
+        if search_info.search_url:
+            search_url = HowLongToBeat.BASE_URL + search_info.search_url
 
-        search_url_with_key = search_url + self._search_info_data.api_key
+        search_url_with_key = search_url + search_info.api_key
         payload = HowLongToBeat._generate_data_payload(game_name, page, None)
-        response_with_key = requests.post(
+        response_with_key = self._session.post(
             search_url_with_key, headers=search_headers, data=payload, timeout=60
         )
 
@@ -253,8 +355,8 @@ class HowLongToBeat(BaseSource):
             return response_with_key
 
         # if the request failed, try to use the search URL with API key in the payload
-        payload = HowLongToBeat._generate_data_payload(game_name, page, self._search_info_data)
-        response_with_payload = requests.post(
+        payload = HowLongToBeat._generate_data_payload(game_name, page, search_info)
+        response_with_payload = self._session.post(
             search_url, headers=search_headers, data=payload, timeout=60
         )
 
@@ -273,17 +375,15 @@ class HowLongToBeat(BaseSource):
     @staticmethod
     def _get_title_request_headers() -> dict[str, Any]:
         """Get headers for the title request."""
-        ua = UserAgent()
-        headers = {"User-Agent": ua.random, "referer": HowLongToBeat.REFERER_HEADER}
+        headers = {"User-Agent": random_user_agent(), "referer": HowLongToBeat.REFERER_HEADER}
         return headers
 
     @staticmethod
     def _get_search_request_headers() -> dict[str, Any]:
-        ua = UserAgent()
         headers = {
             "content-type": "application/json",
             "accept": "*/*",
-            "User-Agent": ua.random.strip(),
+            "User-Agent": random_user_agent().strip(),
             "Referer": HowLongToBeat.REFERER_HEADER,
         }
 
@@ -292,7 +392,7 @@ class HowLongToBeat(BaseSource):
     @staticmethod
     def _generate_data_payload(
         game_name: str, page: int, search_info: SearchInformation | None = None
-    ) -> str:
+    ) -> bytes:
         """Generate data payload
         Args:
             game_name (str): The game name to fetch data for.
@@ -300,38 +400,24 @@ class HowLongToBeat(BaseSource):
             search_info (SearchInformation): Search information containing API key and search URL of the HLTB.
 
         Returns:
-            str: JSON string of the payload to be sent in the request.
+            bytes: JSON encoded payload to be sent in the request.
 
         """
-        payload: dict[str, Any] = {
+        search_options = _SEARCH_OPTIONS
+        # If api_key is passed add it to the users options (shallow copies, the template is shared)
+        if search_info and search_info.api_key:
+            search_options = {
+                **_SEARCH_OPTIONS,
+                "users": {**_SEARCH_OPTIONS["users"], "id": search_info.api_key},
+            }
+
+        payload = {
             "searchType": "games",
             "searchTerms": game_name.split(),
             "searchPage": page,
             "size": 20,
-            "searchOptions": {
-                "games": {
-                    "userId": 0,
-                    "platform": "",
-                    "sortCategory": "popular",
-                    "rangeCategory": "main",
-                    "rangeTime": {"min": 0, "max": 0},
-                    "gameplay": {"perspective": "", "flow": "", "genre": "", "difficulty": ""},
-                    "rangeYear": {"max": "", "min": ""},
-                    "modifier": "",
-                },
-                "users": {"sortCategory": "postcount"},
-                "lists": {"sortCategory": "follows"},
-                "filter": "",
-                "sort": 0,
-                "randomizer": 0,
-            },
+            "searchOptions": search_options,
             "useCache": True,
         }
 
-        # If api_key is passed add it to the dict
-        if search_info and search_info.api_key:
-            search_options = cast(dict[str, Any], payload["searchOptions"])
-            users_options = cast(dict[str, Any], search_options["users"])
-            users_options["id"] = search_info.api_key
-
-        return json.dumps(payload)
+        return serialization.dumps(payload)
@@ -1,6 +1,9 @@
-from typing import Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar
 
 from gameinsights.sources.base import BaseSource, SourceResult, SuccessResult
+from gameinsights.utils import serialization
 from gameinsights.utils.ratelimit import logged_rate_limited
 
 _STEAMACHIEVEMENT_LABELS = (
@@ -9,6 +12,11 @@ _STEAMACHIEVEMENT_LABELS = (
     "achievements_list",
 )
 
+# max schema requests in flight alongside the percentage requests of direct (main thread) calls
+_SCHEMA_FETCH_WORKERS = 4
+
+_EMPTY_SCHEMA_INFO: dict[str, Any] = {"display_name": None, "hidden": None, "description": None}
+
 
 class SteamAchievements(BaseSource):
     _valid_labels: tuple[str, ...] = _STEAMACHIEVEMENT_LABELS
@@ -17,6 +25,10 @@ class SteamAchievements(BaseSource):
         "http://api.steampowered.com/ISteamUserStats/GetGlobalAchievementPercentagesForApp/v0002"
     )
     _schema_url = "http://api.steampowered.com/ISteamUserStats/GetSchemaForGame/v2"
+    # shared by all instances, threads are only spawned on the first submit
+    _executor: ClassVar[ThreadPoolExecutor] = ThreadPoolExecutor(
+        max_workers=_SCHEMA_FETCH_WORKERS, thread_name_prefix="steamachievements-schema"
+    )
 
     def __init__(self, api_key: str | None = None) -> None:
         """Initialize SteamAchievement source."""
@@ -74,24 +86,45 @@ class SteamAchievements(BaseSource):
         # ensure steam_appid is string
         steam_appid = str(steam_appid)
 
-        ## Prepare the params and make request
-        # make request for achievement percentage data
-        params = {
-            "gameid": steam_appid,
-        }
-        response = self._make_request(params=params)
-
-        if response.status_code != 200:
-            return self._build_error_result(
-                f"Failed to connect to API. Status code: {response.status_code}.",
-                verbose=verbose,
+        # the schema request (if api_key is provided) is independent, so run it in the background.
+        # inside a worker thread (Collector, fetch_many) the caller already runs fetches side by
+        # side, so it is made inline instead of queueing behind the small shared pool
+        schema_future = (
+            self._executor.submit(
+                self._fetch_schema_data, steam_appid=steam_appid, verbose=verbose
             )
+            if self._api_key and threading.current_thread() is threading.main_thread()
+            else None
+        )
 
-        percentage_data = response.json()
-
-        # make request for scheme if api_key is provided
-        if self._api_key:
-            schema_data = self._fetch_schema_data(steam_appid=steam_appid, verbose=verbose)
+        try:
+            ## Prepare the params and make request
+            # make request for achievement percentage data
+            params = {
+                "gameid": steam_appid,
+            }
+            response = self._make_request(params=params)
+
+            if response.status_code != 200:
+                return self._build_error_result(
+                    f"Failed to connect to API. Status code: {response.status_code}.",
+                    verbose=verbose,
+                )
+
+            percentage_data = serialization.loads(response.content)
+
+            if schema_future is not None:
+                schema_data: SourceResult | None = schema_future.result()
+            elif self._api_key:
+                schema_data = self._fetch_schema_data(steam_appid=steam_appid, verbose=verbose)
+            else:
+                schema_data = None
+        finally:
+            if schema_future is not None:
+                # on an early return, don't leave a schema request queued for a failed game
+                schema_future.cancel()
+
+        if schema_data is not None:
             if not schema_data["success"]:
                 return self._build_error_result(schema_data["error"], verbose=False)
             data_packed = self._transform_data(
@@ -101,10 +134,7 @@ class SteamAchievements(BaseSource):
             data_packed = self._transform_data(data=percentage_data)
 
         if selected_labels:
-            data_packed = {
-                label: data_packed[label]
-                for label in self._filter_valid_labels(selected_labels=selected_labels)
-            }
+            data_packed = self._select_labels(data_packed, selected_labels)
 
         return SuccessResult(success=True, data=data_packed)
 
@@ -126,7 +156,7 @@ class SteamAchievements(BaseSource):
                 verbose=verbose,
             )
 
-        data = response.json()
+        data = serialization.loads(response.content)
 
         return SuccessResult(success=True, data=data)
 
@@ -141,23 +171,44 @@ class SteamAchievements(BaseSource):
                 "achievements_list": None,
             }
 
-        base_achievements, achievements_count, achievements_percentage_average = (
-            self._calculate_average_percentage(percentage_data)
-        )
-
         schema_achievements = (
             schema_data.get("game", {}).get("availableGameStats", {}).get("achievements", [])
             if schema_data
             else None
         )
+        schema_lookup = (
+            self._build_schema_lookup(schema_achievements) if schema_achievements else None
+        )
+
+        # single pass: parse percentages, accumulate the average and merge schema info inline
+        achievements_list: list[dict[str, Any]] = []
+        total = 0.0
+        for entry in percentage_data:
+            try:
+                name = entry["name"]
+                percentage = float(entry["percent"])
+            except (KeyError, ValueError):
+                continue
+
+            total += percentage
+            if schema_lookup is None:
+                achievements_list.append({"name": name, "percent": percentage})
+                continue
 
-        # merge achievements
-        achievements_list = (
-            self._merge_achievements(
-                base_achievements=base_achievements, schema_data=schema_achievements
+            schema_info = schema_lookup.get(name, _EMPTY_SCHEMA_INFO)
+            achievements_list.append(
+                {
+                    "name": name,
+                    "percent": percentage,
+                    "display_name": schema_info["display_name"],
+                    "hidden": schema_info["hidden"],
+                    "description": schema_info["description"],
+                }
             )
-            if schema_achievements
-            else base_achievements
+
+        achievements_count = len(achievements_list)
+        achievements_percentage_average = (
+            round(total / achievements_count, 2) if achievements_count > 0 else 0.0
         )
 
         return {
@@ -166,78 +217,23 @@ class SteamAchievements(BaseSource):
             "achievements_list": achievements_list,
         }
 
-    def _calculate_average_percentage(
-        self, achievements: list[dict[str, Any]]
-    ) -> tuple[list[dict[str, Any]], int, float]:
-        """Process achievements data. (assuming achievements is not empty)
-        Args:
-            achievements (list of dictionaries): list of achievements.
-        Returns:
-            - list of achievements.
-            - achievements count.
-            - average achievements percentage.
-        """
-        transformed = []
-        total = 0.0
-
-        for entry in achievements:
-            try:
-                percentage = float(entry["percent"])
-                transformed.append({"name": entry["name"], "percent": percentage})
-                total += percentage
-            except (KeyError, ValueError):
-                continue
-
-        count = len(transformed)
-        average = round(total / count, 2) if count > 0 else 0.0
-        return transformed, count, average
-
-    def _merge_achievements(
-        self,
-        base_achievements: list[dict[str, Any]],
-        schema_data: list[dict[str, Any]],
-    ) -> list[dict[str, Any]]:
-        """Merge base achievements (name, percentage) and schema data (name, displayName, etc).
+    @staticmethod
+    def _build_schema_lookup(schema_data: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Index schema entries (name, displayName, etc) by achievement name.
 
         Args:
-            base_achievements: List of achievements from GetGlobalAchievementPercentagesForApp.
             schema_data: List of schema entries from GetSchemaForGame.
 
         Returns:
-            merged list where each base entry is merged with provided schema info.
+            mapping of achievement name to its display_name, hidden and description.
         """
-        # schema lookup by name
-        schema_lookup = {}
-        for entry in schema_data:
-            name = entry.get("name")
-            display_name = entry.get("displayName")
-
-            # skip bad structure (if any)
-            if not name or not display_name:
-                continue
-
-            schema_lookup[name] = {
-                "display_name": display_name,
+        return {
+            entry["name"]: {
+                "display_name": entry["displayName"],
                 "hidden": entry.get("hidden"),
                 "description": entry.get("description"),
             }
-
-        # Merge with base achievements
-        merged = []
-        for acv in base_achievements:
-            name = acv["name"]
-            percent = acv["percent"]
-
-            schema_info = schema_lookup.get(name, {})
-
-            merged.append(
-                {
-                    "name": name,
-                    "percent": percent,
-                    "display_name": schema_info.get("display_name", None),
-                    "hidden": schema_info.get("hidden", None),
-                    "description": schema_info.get("description", None),
-                }
-            )
-
-        return merged
+            for entry in schema_data
+            # skip bad structure (if any)
+            if entry.get("name") and entry.get("displayName")
+        }
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from bs4 import BeautifulSoup
@@ -16,6 +17,15 @@ _STEAMCHARTS_LABELS = (
 )
 
 
+@lru_cache(maxsize=1024)
+def _to_iso_month(month: str) -> str:
+    """Convert a SteamCharts month (e.g. 'January 2024') to 'YYYY-MM'.
+
+    Every game lists the same months, so each one is only parsed once.
+    """
+    return datetime.strptime(month, "%B %Y").strftime("%Y-%m")
+
+
 class SteamCharts(BaseSource):
     """SteamCharts source for fetching active player data from SteamCharts website."""
 
@@ -116,10 +126,7 @@ class SteamCharts(BaseSource):
         }
 
         if selected_labels:
-            data_packed = {
-                label: data_packed[label]
-                for label in self._filter_valid_labels(selected_labels=selected_labels)
-            }
+            data_packed = self._select_labels(data_packed, selected_labels)
 
         return SuccessResult(success=True, data=data_packed)
 
@@ -135,7 +142,7 @@ class SteamCharts(BaseSource):
 
             monthly_active_player.append(
                 {
-                    "month": datetime.strptime(month, "%B %Y").strftime("%Y-%m"),
+                    "month": _to_iso_month(month),
                     "average_players": float(avg_players.replace(",", "")),
                     "gain": float(gain.replace(",", "")) if gain not in ("-", "") else None,
                     "percentage_gain": (
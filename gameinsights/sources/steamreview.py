@@ -2,8 +2,12 @@ import time
 from typing import Any, Literal, TypedDict, cast
 
 from gameinsights.sources.base import BaseSource, SourceResult, SuccessResult
+from gameinsights.utils import serialization
 from gameinsights.utils.ratelimit import logged_rate_limited
 
+# seconds between two review page requests, to be polite
+_PAGE_DELAY = 0.5
+
 _STEAMREVIEW_SUMMARY_LABELS = (
     "review_score",
     "review_score_desc",
@@ -119,15 +123,21 @@ class SteamReview(BaseSource):
 
         if mode == "summary":
             if selected_labels:
-                summary_data = {
-                    label: summary_data[label]
-                    for label in self._filter_valid_labels(selected_labels=selected_labels)
-                }
+                summary_data = self._select_labels(summary_data, selected_labels)
             return SuccessResult(
                 success=True,
                 data=summary_data,
             )
 
+        # resolve the review labels once instead of for every review
+        review_labels = (
+            self._filter_valid_labels(
+                valid_labels=_STEAMREVIEW_REVIEW_LABELS, selected_labels=selected_labels
+            )
+            if selected_labels
+            else None
+        )
+
         reviews_data: list[dict[str, Any]] = []
         while True:
             # log the total reviews
@@ -142,22 +152,15 @@ class SteamReview(BaseSource):
 
             for review in page_data["reviews"]:
                 review_data = self._transform_data(review, "review")
-                if selected_labels:
-                    review_data = {
-                        label: review_data[label]
-                        for label in self._filter_valid_labels(
-                            valid_labels=_STEAMREVIEW_REVIEW_LABELS,
-                            selected_labels=selected_labels,
-                        )
-                    }
+                if review_labels is not None:
+                    review_data = {label: review_data[label] for label in review_labels}
                 reviews_data.append(review_data)
 
-            # add internal sleep
-            time.sleep(0.5)
-
             if params["cursor"] == page_data["cursor"]:
                 break
 
+            # pause only between pages, nothing to wait for after the last one
+            time.sleep(_PAGE_DELAY)
             params["cursor"] = page_data["cursor"]
             page_data = self._fetch_page(steam_appid=steam_appid, params=params)
 
@@ -172,7 +175,7 @@ class SteamReview(BaseSource):
     @logged_rate_limited(calls=100000, period=24 * 60 * 60)
     def _fetch_page(self, steam_appid: str, params: dict[str, Any]) -> SteamReviewResponse:
         response = self._make_request(endpoint=steam_appid, params=params)
-        return cast(SteamReviewResponse, response.json())
+        return cast(SteamReviewResponse, serialization.loads(response.content))
 
     def _transform_data(
         self,
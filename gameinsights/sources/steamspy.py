@@ -1,6 +1,7 @@
 from typing import Any
 
 from gameinsights.sources.base import BaseSource, SourceResult, SuccessResult
+from gameinsights.utils import serialization
 from gameinsights.utils.ratelimit import logged_rate_limited
 
 _STEAMSPY_LABELS = (
@@ -24,6 +25,27 @@ _STEAMSPY_LABELS = (
     "tags",
 )
 
+# (label, steamspy key) pairs for every label copied as-is from the response
+_STEAMSPY_KEYMAP = (
+    ("steam_appid", "appid"),
+    ("name", "name"),
+    ("developers", "developer"),
+    ("publishers", "publisher"),
+    ("positive_reviews", "positive"),
+    ("negative_reviews", "negative"),
+    ("owners", "owners"),
+    ("average_forever", "average_forever"),
+    ("average_2weeks", "average_2weeks"),
+    ("median_forever", "median_forever"),
+    ("median_2weeks", "median_2weeks"),
+    ("price", "price"),
+    ("initial_price", "initialprice"),
+    ("discount", "discount"),
+    ("ccu", "ccu"),
+    ("languages", "languages"),
+    ("genres", "genre"),
+)
+
 
 class SteamSpy(BaseSource):
     _valid_labels: tuple[str, ...] = _STEAMSPY_LABELS
@@ -70,7 +92,7 @@ class SteamSpy(BaseSource):
                 f"Failed to connect to API. Status code: {response.status_code}", verbose=verbose
             )
 
-        data = response.json()
+        data = serialization.loads(response.content)
         if not data.get("name", None):
             return self._build_error_result(
                 f"Game with appid {steam_appid} is not found.", verbose=verbose
@@ -79,33 +101,15 @@ class SteamSpy(BaseSource):
         data_packed = self._transform_data(data=data)
 
         if selected_labels:
-            data_packed = {
-                label: data_packed[label] for label in self._filter_valid_labels(selected_labels)
-            }
+            data_packed = self._select_labels(data_packed, selected_labels)
 
         return SuccessResult(success=True, data=data_packed)
 
     def _transform_data(self, data: dict[str, Any]) -> dict[str, Any]:
         # repack / process the data if needed
         tags = data.get("tags", [])
-        tags = [tag for tag, count in tags.items()] if isinstance(tags, dict) else []
-        return {
-            "steam_appid": data.get("appid", None),
-            "name": data.get("name", None),
-            "developers": data.get("developer", None),
-            "publishers": data.get("publisher", None),
-            "positive_reviews": data.get("positive", None),
-            "negative_reviews": data.get("negative", None),
-            "owners": data.get("owners", None),
-            "average_forever": data.get("average_forever", None),
-            "average_2weeks": data.get("average_2weeks", None),
-            "median_forever": data.get("median_forever", None),
-            "median_2weeks": data.get("median_2weeks", None),
-            "price": data.get("price", None),
-            "initial_price": data.get("initialprice", None),
-            "discount": data.get("discount", None),
-            "ccu": data.get("ccu", None),
-            "languages": data.get("languages", None),
-            "genres": data.get("genre", None),
-            "tags": tags,
-        }
+        tags = list(tags) if isinstance(tags, dict) else []
+        get = data.get
+        transformed = {label: get(key) for label, key in _STEAMSPY_KEYMAP}
+        transformed["tags"] = tags
+        return transformed
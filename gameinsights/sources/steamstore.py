@@ -1,6 +1,7 @@
 from typing import Any
 
 from gameinsights.sources.base import BaseSource, SourceResult, SuccessResult
+from gameinsights.utils import serialization
 from gameinsights.utils.ratelimit import logged_rate_limited
 
 _STEAM_LABELS = (
@@ -122,7 +123,7 @@ class SteamStore(BaseSource):
                 f"Failed to connect to API. Status code: {response.status_code}.", verbose=verbose
             )
 
-        data = response.json()
+        data = serialization.loads(response.content)
 
         # check if the response contains the expected data
         if steam_appid not in data or not data[steam_appid]["success"]:
@@ -135,9 +136,7 @@ class SteamStore(BaseSource):
         data_packed = self._transform_data(data[steam_appid]["data"])
 
         if selected_labels:
-            data_packed = {
-                label: data_packed[label] for label in self._filter_valid_labels(selected_labels)
-            }
+            data_packed = self._select_labels(data_packed, selected_labels)
 
         return SuccessResult(success=True, data=data_packed)
 
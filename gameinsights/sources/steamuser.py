@@ -2,6 +2,7 @@ from enum import IntEnum
 from typing import Any, Literal
 
 from gameinsights.sources.base import BaseSource, SourceResult, SuccessResult
+from gameinsights.utils import serialization
 from gameinsights.utils.ratelimit import logged_rate_limited
 
 _STEAMUSER_LABELS = (
@@ -121,10 +122,7 @@ class SteamUser(BaseSource):
                 data_packed["recently_played_games"] = recently_played_games_result["data"]
 
         if selected_labels:
-            data_packed = {
-                label: data_packed[label]
-                for label in self._filter_valid_labels(selected_labels=selected_labels)
-            }
+            data_packed = self._select_labels(data_packed, selected_labels)
 
         return SuccessResult(success=True, data=data_packed)
 
@@ -147,7 +145,7 @@ class SteamUser(BaseSource):
                 verbose=verbose,
             )
 
-        data = response.json()
+        data = serialization.loads(response.content)
         players = data.get("response", {}).get("players", [])
 
         if not players:
@@ -171,7 +169,7 @@ class SteamUser(BaseSource):
         response = self._make_request(url=self._owned_games_url, params=params)
 
         if response.status_code == 200:
-            data = response.json().get("response", {})
+            data = serialization.loads(response.content).get("response", {})
             return SuccessResult(
                 success=True, data=self._transform_data(data=data, data_type="games_owned")
             )
@@ -189,7 +187,7 @@ class SteamUser(BaseSource):
         response = self._make_request(url=self._recently_played_url, params=params)
 
         if response.status_code == 200:
-            data = response.json().get("response", {})
+            data = serialization.loads(response.content).get("response", {})
             return SuccessResult(
                 success=True, data=self._transform_data(data=data, data_type="recent_games")
             )
@@ -3,6 +3,7 @@ from typing import Any, cast
 import requests
 from rapidfuzz import fuzz, process
 
+from gameinsights.utils import serialization
 from gameinsights.utils.logger import LoggerWrapper
 
 
@@ -25,7 +26,7 @@ class GameSearch:
         response = requests.get(self._STEAM_APPLIST_URL)
         response.raise_for_status()
 
-        return cast(list[dict[str, Any]], response.json()["applist"]["apps"])
+        return cast(list[dict[str, Any]], serialization.loads(response.content)["applist"]["apps"])
 
     def search_by_name(
         self, game_name: str, top_n: int = 5, verbose: bool = True
@@ -5,6 +5,20 @@ import logging
 import os
 from typing import Any
 
+from gameinsights.utils import serialization
+
+# exact types rendered with str(), everything else falls back to repr()
+_SIMPLE_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None)})
+
+_LEVEL_MAP: dict[str, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
 
 class LoggerWrapper:
     def __init__(self, name: str) -> None:
@@ -32,8 +46,13 @@ class LoggerWrapper:
         if not verbose:
             return
 
-        formatted = self._format_message(message, context)
-        getattr(self._logger, level.lower())(formatted)
+        level_no = _LEVEL_MAP.get(level.lower(), logging.INFO)
+        # don't pay for the formatting if the record would be dropped anyway
+        if not self._logger.isEnabledFor(level_no):
+            return
+
+        formatted = self._format_message(message, context) if context else message
+        self._logger.log(level_no, formatted)
 
     def log_event(
         self, event: str, level: str = "info", verbose: bool = False, **context: Any
@@ -50,19 +69,20 @@ class LoggerWrapper:
 
         if self._json_mode:
             payload = {"message": message, "logger": self._logger.name, **context}
+            # unknown types are rendered with str(), values orjson rejects outright (e.g. ints
+            # wider than 64 bits) are retried with the stdlib json inside serialization.dumps
             try:
-                return json.dumps(payload, default=str)
-            except TypeError:
+                return serialization.dumps(
+                    payload, default=str, option=serialization.OPT_NON_STR_KEYS
+                ).decode()
+            except (TypeError, ValueError):
                 safe_payload = {key: self._stringify(value) for key, value in payload.items()}
                 return json.dumps(safe_payload)
 
-        kv_pairs = " ".join(
-            f"{key}={self._stringify(value)}" for key, value in sorted(context.items())
-        )
+        # context keeps the caller's (insertion) order
+        kv_pairs = " ".join(f"{key}={self._stringify(value)}" for key, value in context.items())
         return f"{message} | {kv_pairs}"
 
     @staticmethod
     def _stringify(value: Any) -> str:
-        if isinstance(value, (str, int, float, bool)) or value is None:
-            return str(value)
-        return repr(value)
+        return str(value) if type(value) in _SIMPLE_TYPES else repr(value)
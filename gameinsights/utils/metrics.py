@@ -1,73 +1,203 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import queue
 import threading
 import time
-from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Iterator
+from typing import Any
+
+from gameinsights.utils import serialization
 
 
 def _is_enabled() -> bool:
     return os.getenv("GAMEINSIGHTS_METRICS", "").lower() in {"1", "true", "yes"}
 
 
+# max size (in characters) of the metric lines written in one batch
+_BATCH_MAX_CHARS = 64 * 1024
+
+
+class _BatchStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """Stream handler that holds formatted records until flush, then writes them in one call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pending: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._pending.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            pending = "".join(self._pending)
+            self._pending.clear()
+            if pending:
+                self.stream.write(pending)
+            super().flush()
+        except (OSError, ValueError):
+            # the stream is gone (e.g. closed at interpreter exit), drop the batch
+            pass
+        finally:
+            self.release()
+
+
 def _build_logger() -> logging.Logger:
     logger = logging.getLogger("gameinsights.metrics")
     if not logger.handlers:
-        handler = logging.StreamHandler()
+        handler = _BatchStreamHandler()
         handler.setFormatter(logging.Formatter("%(message)s"))
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
     return logger
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerResult:
+    # elapsed seconds, plus the integer nanoseconds measured by timers
     duration: float = 0.0
+    duration_ns: int = 0
+
+
+class _Timer:
+    """Context manager recording the elapsed seconds of its block.
+
+    The duration is always measured (callers read it for their logs), but only emitted when enabled.
+    """
+
+    __slots__ = ("_collector", "_name", "_labels", "_result", "_start")
+
+    def __init__(self, collector: MetricsCollector, name: str, labels: dict[str, Any]) -> None:
+        self._collector = collector
+        self._name = name
+        self._labels = labels
+        self._result = TimerResult()
+        self._start = 0
+
+    def __enter__(self) -> TimerResult:
+        self._start = time.perf_counter_ns()
+        return self._result
+
+    def __exit__(self, *exc_info: object) -> None:
+        # integer nanoseconds, seconds are only derived when read/emitted
+        self._result.duration_ns = time.perf_counter_ns() - self._start
+        self._result.duration = self._result.duration_ns * 1e-9
+        if self._collector._enabled:
+            self._collector._emit("observation", self._name, self._result.duration, self._labels)
 
 
 class MetricsCollector:
-    """Lightweight metrics collector that emits structured logs when enabled."""
+    """Lightweight metrics collector that emits structured logs when enabled.
+
+    Producers only enqueue the payload, a background thread serializes and writes them in batches.
+    """
 
     def __init__(self) -> None:
         self._enabled = _is_enabled()
         self._lock = threading.Lock()
         self._logger = _build_logger()
+        self._queue: queue.SimpleQueue[dict[str, Any] | threading.Event] = queue.SimpleQueue()
+        self._drainer: threading.Thread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether metrics are emitted, lets callers skip building labels when disabled."""
+        return self._enabled
 
     def _emit(self, metric_type: str, name: str, value: float, labels: dict[str, Any]) -> None:
         if not self._enabled:
             return
-        payload = {
-            "metric": name,
-            "type": metric_type,
-            "value": value,
-            "labels": labels,
-            "timestamp": time.time(),
-        }
+        if self._drainer is None:
+            self._start_drainer()
+        self._queue.put(
+            {
+                "metric": name,
+                "type": metric_type,
+                "value": value,
+                "labels": labels,
+                "timestamp": time.time(),
+            }
+        )
+
+    def _start_drainer(self) -> None:
         with self._lock:
-            self._logger.info(json.dumps(payload, default=str))
+            if self._drainer is None:
+                self._drainer = threading.Thread(
+                    target=self._drain, name="gameinsights-metrics", daemon=True
+                )
+                self._drainer.start()
+                atexit.register(self.flush)
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            waiters: list[threading.Event] = []
+            size = 0
+            try:
+                # write whatever is already queued as one batch, up to the batch size
+                while True:
+                    if isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        size += self._write(item)
+                    if size >= _BATCH_MAX_CHARS:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+                for handler in self._logger.handlers:
+                    handler.flush()
+            except Exception:
+                # never let a bad batch end the drainer, later metrics would pile up unwritten
+                pass
+            finally:
+                for waiter in waiters:
+                    waiter.set()
+
+    def _write(self, item: dict[str, Any]) -> int:
+        """Serialize and log a single metric, returns the size of the written line."""
+        try:
+            line = serialization.dumps(item, default=str).decode()
+        except (TypeError, ValueError):
+            # neither orjson nor the stdlib could encode it (e.g. circular labels), keep the
+            # metric with its values as strings
+            line = json.dumps({key: str(value) for key, value in item.items()})
+        try:
+            self._logger.info(line)
+        except Exception:
+            return 0
+        return len(line)
+
+    def flush(self, timeout: float | None = 5.0) -> None:
+        """Block until the metrics emitted so far have been written."""
+        if self._drainer is None or not self._drainer.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
 
     def counter(self, name: str, value: int = 1, **labels: Any) -> None:
         """Increment a counter metric."""
-        self._emit("counter", name, value, labels)
+        if self._enabled:
+            self._emit("counter", name, value, labels)
 
     def observe(self, name: str, value: float, **labels: Any) -> None:
         """Record an observation (histogram/gauge)."""
-        self._emit("observation", name, value, labels)
+        if self._enabled:
+            self._emit("observation", name, value, labels)
 
-    @contextmanager
-    def timer(self, name: str, **labels: Any) -> Iterator[TimerResult]:
+    def timer(self, name: str, **labels: Any) -> _Timer:
         """Context manager to record elapsed seconds for an operation."""
-        result = TimerResult()
-        start = time.perf_counter()
-        try:
-            yield result
-        finally:
-            result.duration = time.perf_counter() - start
-            self.observe(name, result.duration, **labels)
+        return _Timer(self, name, labels)
 
 
 metrics = MetricsCollector()
@@ -1,66 +1,101 @@
 import logging
+import threading
 import time
 from collections.abc import Callable
 from functools import wraps
 from typing import Any
 
-from ratelimit import RateLimitException, limits
-
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# guards the per-instance bucket creation so concurrent callers share a single bucket
+_cache_lock = threading.Lock()
 
-def logged_sleep_and_retry(func: Callable[..., Any]) -> Callable[..., Any]:
-    @wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        while True:
-            try:
-                return func(*args, **kwargs)
-            except RateLimitException as e:
-                logger.info(
-                    f"[RateLimiter] Rate limit exceeded. "
-                    f"Sleeping for {e.period_remaining:.2f}s before retrying..."
-                )
-                time.sleep(e.period_remaining)
 
-    return wrapper
+class _TokenBucket:
+    """Token bucket allowing `calls` requests per `period` seconds, safe to share across threads.
+
+    The lock is only held while the tokens are refilled/taken, callers sleep outside of it.
+    """
+
+    __slots__ = ("calls", "period", "rate", "capacity", "tokens", "last", "lock")
+
+    def __init__(self, calls: int, period: float) -> None:
+        self.calls = calls
+        self.period = period
+        self.rate = calls / period
+        self.capacity = float(calls)
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a token if available.
+        Returns:
+            float: 0.0 if a token was taken, otherwise the seconds to wait before the next one.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return 0.0
+            return (1.0 - self.tokens) / self.rate
+
+
+def _get_bucket(
+    instance: Any, bucket_attr: str, calls: int | None, period: int | None
+) -> _TokenBucket:
+    """Return the instance's bucket, creating it on first use.
+
+    The rate is frozen when the bucket is created, later changes to the instance's
+    `rate_limit` or `calls`/`period` don't affect it.
+    """
+    with _cache_lock:
+        # re-check, another thread might have built the bucket already
+        bucket: _TokenBucket | None = getattr(instance, bucket_attr, None)
+        if bucket is None:
+            override: tuple[int, int] | None = getattr(instance, "rate_limit", None)
+            if override is not None:
+                actual_calls, actual_period = override
+            else:
+                actual_calls = calls if calls is not None else getattr(instance, "calls", 60)
+                actual_period = period if period is not None else getattr(instance, "period", 60)
+            bucket = _TokenBucket(actual_calls, actual_period)
+            setattr(instance, bucket_attr, bucket)
+        return bucket
 
 
 def logged_rate_limited(
     calls: int | None = None, period: int | None = None
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorator for rate limiting with logging.
+
+    Falls back to the instance's `calls`/`period` when not given, an instance `rate_limit`
+    (calls, period) tuple takes precedence over both.
     Args:
         calls (int): Max number of calls allowed.
         period (int): Time period in seconds for the rate limit.
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        cache_attr = f"__logged_rate_limit_cache_{func.__name__}"
+        bucket_attr = f"__logged_rate_limit_bucket_{func.__name__}"
 
         @wraps(func)
         def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
-            actual_calls = calls if calls is not None else getattr(self, "calls", 60)
-            actual_period = period if period is not None else getattr(self, "period", 60)
-
-            cache = getattr(self, cache_attr, None)
-            if cache is None or cache["calls"] != actual_calls or cache["period"] != actual_period:
+            bucket: _TokenBucket | None = getattr(self, bucket_attr, None)
+            if bucket is None:
+                bucket = _get_bucket(self, bucket_attr, calls, period)
 
-                def bound(*call_args: Any, **call_kwargs: Any) -> Any:
-                    return func(self, *call_args, **call_kwargs)
-
-                limited: Callable[..., Any] = logged_sleep_and_retry(
-                    limits(calls=actual_calls, period=actual_period)(bound)
+            while (wait := bucket.try_acquire()) > 0.0:
+                logger.info(
+                    f"[RateLimiter] Rate limit exceeded. "
+                    f"Sleeping for {wait:.2f}s before retrying..."
                 )
-                cache = {
-                    "calls": actual_calls,
-                    "period": actual_period,
-                    "limited": limited,
-                }
-                setattr(self, cache_attr, cache)
-
-            limited_execution = cache["limited"]
-            return limited_execution(*args, **kwargs)
+                time.sleep(wait)
+
+            return func(self, *args, **kwargs)
 
         return wrapper
 
@@ -0,0 +1,36 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+# orjson's decode error subclasses json.JSONDecodeError (and ValueError)
+JSONDecodeError = orjson.JSONDecodeError
+# allow dict keys that are not str (e.g. ints), they are serialized as strings
+OPT_NON_STR_KEYS = orjson.OPT_NON_STR_KEYS
+# pretty-print with a 2 space indent
+OPT_INDENT_2 = orjson.OPT_INDENT_2
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Deserialize JSON, prefer passing the raw bytes (e.g. response.content) to skip decoding."""
+    return orjson.loads(data)
+
+
+def dumps(
+    obj: Any, default: Callable[[Any], Any] | None = None, option: int | None = None
+) -> bytes:
+    """Serialize obj to compact UTF-8 encoded JSON bytes.
+
+    default is called for objects orjson can't serialize natively, option takes orjson OPT_* flags.
+    orjson rejects some values without calling default (e.g. ints wider than 64 bits, or non-str
+    keys without OPT_NON_STR_KEYS), those are retried with the stdlib json module.
+    """
+    try:
+        return orjson.dumps(obj, default=default, option=option)
+    except TypeError:
+        indent = 2 if option and option & OPT_INDENT_2 else None
+        separators = None if indent else (",", ":")
+        return json.dumps(
+            obj, default=default, indent=indent, separators=separators, ensure_ascii=False
+        ).encode("utf-8")
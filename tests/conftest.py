@@ -1,9 +1,20 @@
+import json
 from unittest.mock import Mock
 
 import pytest
 import requests
 
 
+@pytest.fixture(autouse=True)
+def clear_hltb_search_info_cache():
+    """Keep the HowLongToBeat search information cache from leaking between tests."""
+    from gameinsights.sources.howlongtobeat import HowLongToBeat
+
+    HowLongToBeat.clear_search_info_cache()
+    yield
+    HowLongToBeat.clear_search_info_cache()
+
+
 @pytest.fixture
 def mock_request_response(monkeypatch):
     """Factory fixture to mock a response and patch _make_request in the target class"""
@@ -14,11 +25,12 @@ def mock_request_response(monkeypatch):
         status_code: int = 200,
         json_data: dict | None = None,
         text_data: str | None = None,
-        side_effect: list | None = None,
+        side_effect: list | dict | None = None,
     ):
         class Response:
-            def __init__(self, status_code, json_data, text_data):
+            def __init__(self, status_code, json_data, text_data, headers=None):
                 self.status_code = status_code
+                self.headers = headers or {}
                 self.ok = 200 <= status_code < 300
                 self._json = json_data
                 self._text = text_data or ""
@@ -31,14 +43,37 @@ def mock_request_response(monkeypatch):
             def text(self):
                 return self._text
 
+            @property
+            def content(self):
+                if self._text:
+                    return self._text.encode("utf-8")
+                return json.dumps(self._json).encode("utf-8")
+
             def raise_for_status(self):
                 if not self.ok:
                     raise requests.HTTPError(f"Mock error {self.status_code}")
 
         def make_response_from_dict(d):
-            return Response(d.get("status_code", 200), d.get("json_data"), d.get("text_data"))
+            return Response(
+                d.get("status_code", 200), d.get("json_data"), d.get("text_data"), d.get("headers")
+            )
 
-        if side_effect:
+        if isinstance(side_effect, dict):
+            # route by the requested url (None is the source's default url),
+            # for sources that issue their requests concurrently
+            routes = {
+                url: e if isinstance(e, Exception) else make_response_from_dict(e)
+                for url, e in side_effect.items()
+            }
+
+            def _route(*args, **kwargs):
+                response = routes[kwargs.get("url")]
+                if isinstance(response, Exception):
+                    raise response
+                return response
+
+            mock_method = Mock(side_effect=_route)
+        elif side_effect:
             # now it takes either exception or dict
             responses = [
                 e if isinstance(e, Exception) else make_response_from_dict(e) for e in side_effect
@@ -65,39 +100,27 @@ def mock_request_response(monkeypatch):
 
 
 @pytest.fixture
-def stub_ratelimit(monkeypatch):
+def fake_clock(monkeypatch):
+    """Patch the rate limiter's clock, sleeping advances the monotonic time instantly."""
     import gameinsights.utils.ratelimit as ratelimit_module
 
-    class StubRateLimitException(Exception):
-        def __init__(self, message="rate limit exceeded", period_remaining=0.0):
-            super().__init__(message)
-            self.period_remaining = period_remaining
-
-    class StubLimiter:
+    class FakeClock:
         def __init__(self):
-            self.limits_invocations = 0
-
-        def limits(self, *, calls: int, period: int):
-            self.limits_invocations += 1
-            state = {"count": 0}
-
-            def decorator(func):
-                def wrapped(*args, **kwargs):
-                    if state["count"] >= calls:
-                        state["count"] = 0
-                        raise StubRateLimitException("Rate limit exceeded", float(period))
-                    state["count"] += 1
-                    return func(*args, **kwargs)
+            self.now = 1000.0
+            self.sleeps: list[float] = []
 
-                return wrapped
+        def monotonic(self):
+            return self.now
 
-            return decorator
+        def sleep(self, duration):
+            self.sleeps.append(duration)
+            self.now += duration
 
-    stub = StubLimiter()
-    monkeypatch.setattr(ratelimit_module, "RateLimitException", StubRateLimitException)
-    monkeypatch.setattr(ratelimit_module, "limits", stub.limits)
+    clock = FakeClock()
+    monkeypatch.setattr(ratelimit_module.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ratelimit_module.time, "sleep", clock.sleep)
 
-    return stub
+    return clock
 
 
 @pytest.fixture
@@ -123,3 +123,42 @@ class TestGameDataModel:
         # check the length of the recap data
         assert len(recap_data) == len(game_data._RECAP_FIELDS)
         assert "count_retired" not in recap_data  # this field should not be in recap data
+        # the recap keeps a stable field order
+        assert list(recap_data) == list(game_data._RECAP_FIELDS)
+
+    def test_recap_fields_are_unique(self):
+        recap_fields = GameDataModel._RECAP_FIELDS
+
+        assert len(recap_fields) == len(set(recap_fields))
+        assert {"total_reviews", "copies_sold"} <= set(recap_fields)
+        # every recap field is a model field
+        assert set(recap_fields) <= set(GameDataModel.model_fields)
+
+    def test_field_coercers_cover_model_fields(self):
+        from gameinsights.model.game_data import _FIELD_COERCERS
+
+        # a typo in the field sets would silently skip the coercion
+        assert set(_FIELD_COERCERS) <= set(GameDataModel.model_fields)
+
+    @pytest.mark.parametrize(
+        "raw_release_date, expected",
+        [
+            ("Jun 15, 2023", datetime(2023, 6, 15)),
+            ("jan 5, 2020", datetime(2020, 1, 5)),
+            ("Sep 31, 2023", None),
+            ("15 Jun, 2023", None),
+            ("Coming soon", None),
+        ],
+    )
+    def test_parse_release_date(self, raw_release_date, expected):
+        game_data = GameDataModel(steam_appid="12345", release_date=raw_release_date)
+
+        assert game_data.release_date == expected
+
+    def test_days_since_release_uses_context_now(self):
+        game_data = GameDataModel.model_validate(
+            {"steam_appid": "12345", "release_date": "Jan 1, 2024"},
+            context={"now": datetime(2024, 1, 31, 23, 59)},
+        )
+
+        assert game_data.days_since_release == 30
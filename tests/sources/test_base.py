@@ -51,6 +51,31 @@ class TestBaseSource:
         assert isinstance(result, list)
         assert result == expected
 
+    @pytest.mark.parametrize(
+        "selected_labels, expected",
+        [
+            (["test_label_2", "test_label_1"], {"test_label_2": 2, "test_label_1": 1}),
+            (["test_label_1", "invalid"], {"test_label_1": 1}),
+            ([], {}),
+        ],
+    )
+    def test_select_labels(self, base_source_fixture, selected_labels, expected):
+        data = {"test_label_1": 1, "test_label_2": 2}
+
+        result = base_source_fixture._select_labels(data, selected_labels)
+
+        assert result == expected
+        assert list(result) == list(expected)
+
+    def test_select_labels_all_labels_returns_data(self, base_source_fixture):
+        data = {"test_label_1": 1, "test_label_2": 2}
+
+        assert base_source_fixture._select_labels(data, ["test_label_1", "test_label_2"]) is data
+
+        reordered = base_source_fixture._select_labels(data, ["test_label_2", "test_label_1"])
+        assert reordered is not data
+        assert list(reordered) == ["test_label_2", "test_label_1"]
+
     @pytest.mark.parametrize(
         "attempt, expected_result",
         [
@@ -73,7 +98,7 @@ class TestBaseSource:
         self, mock_request_response, base_source_fixture, attempt, expected_result
     ):
         mock_get = mock_request_response(
-            target_class=requests, method_name="get", side_effect=attempt
+            target_class=requests.Session, method_name="get", side_effect=attempt
         )
         result = base_source_fixture._make_request()
 
@@ -87,10 +112,223 @@ class TestBaseSource:
             requests.exceptions.Timeout("timeout 3"),
         ]
         mock_get = mock_request_response(
-            target_class=requests, method_name="get", side_effect=attempt
+            target_class=requests.Session, method_name="get", side_effect=attempt
         )
         result = base_source_fixture._make_request()
 
         assert mock_get.call_count == 3
         assert result.status_code == base.SYNTHETIC_ERROR_CODE
         assert not result.ok
+
+    def test_make_request_retries_rate_limited_response(
+        self, mock_request_response, base_source_fixture, monkeypatch
+    ):
+        sleeps = []
+        monkeypatch.setattr(base.time, "sleep", sleeps.append)
+        mock_get = mock_request_response(
+            target_class=requests.Session,
+            method_name="get",
+            side_effect=[
+                {"status_code": 429, "headers": {"Retry-After": "2"}},
+                {"json_data": {"ok": True}},
+            ],
+        )
+
+        result = base_source_fixture._make_request()
+
+        assert result.status_code == 200
+        assert mock_get.call_count == 2
+        assert sleeps == [2.0]
+
+    def test_make_request_returns_last_response_when_still_unavailable(
+        self, mock_request_response, base_source_fixture, monkeypatch
+    ):
+        sleeps = []
+        monkeypatch.setattr(base.time, "sleep", sleeps.append)
+        mock_get = mock_request_response(
+            target_class=requests.Session,
+            method_name="get",
+            side_effect=[{"status_code": 503}] * 3,
+        )
+
+        result = base_source_fixture._make_request()
+
+        assert result.status_code == 503
+        assert mock_get.call_count == 3
+        assert len(sleeps) == 2
+        # exponential backoff (0.5s, 1s) plus up to backoff_factor of jitter
+        assert 0.5 <= sleeps[0] <= 1.0
+        assert 1.0 <= sleeps[1] <= 1.5
+
+    def test_make_request_waits_for_exhausted_quota_on_success(
+        self, mock_request_response, base_source_fixture, monkeypatch
+    ):
+        sleeps = []
+        monkeypatch.setattr(base.time, "sleep", sleeps.append)
+        monkeypatch.setattr(base.time, "time", lambda: 1000.0)
+        mock_get = mock_request_response(
+            target_class=requests.Session,
+            method_name="get",
+            side_effect=[
+                {
+                    "json_data": {"ok": True},
+                    "headers": {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1005"},
+                },
+                {"json_data": {"ok": True}},
+            ],
+        )
+
+        first = base_source_fixture._make_request()
+        # the successful response is returned right away
+        assert first.status_code == 200
+        assert sleeps == []
+
+        second = base_source_fixture._make_request()
+        # the next request waits for the quota to reset instead of running into a 429
+        assert second.status_code == 200
+        assert sleeps == [5.0]
+        assert mock_get.call_count == 2
+
+    def test_make_request_does_not_wait_with_quota_left(
+        self, mock_request_response, base_source_fixture, monkeypatch
+    ):
+        sleeps = []
+        monkeypatch.setattr(base.time, "sleep", sleeps.append)
+        mock_request_response(
+            target_class=requests.Session,
+            method_name="get",
+            side_effect=[
+                {
+                    "json_data": {"ok": True},
+                    "headers": {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "9999999999"},
+                },
+                {"json_data": {"ok": True}},
+            ],
+        )
+
+        base_source_fixture._make_request()
+        base_source_fixture._make_request()
+
+        assert sleeps == []
+
+    def test_make_request_retries_is_total_attempts(
+        self, mock_request_response, base_source_fixture, monkeypatch
+    ):
+        monkeypatch.setattr(base.time, "sleep", lambda _: None)
+        mock_get = mock_request_response(
+            target_class=requests.Session,
+            method_name="get",
+            side_effect=[requests.exceptions.Timeout("timeout")] * 3,
+        )
+
+        result = base_source_fixture._make_request(retries=2)
+
+        assert mock_get.call_count == 2
+        assert result.status_code == base.SYNTHETIC_ERROR_CODE
+
+    @pytest.mark.parametrize(
+        "headers, expected",
+        [
+            ({"Retry-After": "120"}, base._MAX_RETRY_DELAY),
+            ({"Retry-After": "Wed, 21 Oct 2015 07:28:05 GMT"}, 5.0),
+            ({"Retry-After": "Wed, 21 Oct 2015 07:27:00 GMT"}, 0.0),
+            ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1445412510"}, 30.0),
+        ],
+        ids=[
+            "retry_after_capped",
+            "retry_after_date",
+            "retry_after_date_in_past",
+            "ratelimit_reset",
+        ],
+    )
+    def test_retry_delay_follows_headers(self, monkeypatch, headers, expected):
+        # Wed, 21 Oct 2015 07:28:00 GMT
+        monkeypatch.setattr(base.time, "time", lambda: 1445412480.0)
+        response = requests.Response()
+        response.headers.update(headers)
+
+        assert base._retry_delay(response, backoff_factor=0.5, attempts=1) == expected
+
+    def test_fetch_many(self, base_source_fixture, monkeypatch):
+        fetched = []
+
+        def fake_fetch(appid, verbose=True, selected_labels=None):
+            fetched.append(appid)
+            return {"success": True, "data": {"steam_appid": appid}}
+
+        monkeypatch.setattr(base_source_fixture, "fetch", fake_fetch)
+
+        result = base_source_fixture.fetch_many(["1", 2, "1"], max_workers=2)
+
+        assert list(result) == ["1", "2"]
+        assert sorted(fetched) == ["1", "2"]
+        assert result["2"]["data"] == {"steam_appid": "2"}
+
+    @pytest.mark.parametrize(
+        "base_url, endpoint, expected",
+        [
+            ("https://api.testurl.com/", None, "https://api.testurl.com"),
+            ("https://api.testurl.com/", "570", "https://api.testurl.com/570"),
+            ("https://api.testurl.com/app", "570/", "https://api.testurl.com/app/570"),
+        ],
+        ids=["no_endpoint", "endpoint", "nested_endpoint"],
+    )
+    def test_build_url(self, base_url, endpoint, expected):
+        assert base._build_url(base_url, endpoint) == expected
+
+    def test_name(self, base_source_fixture):
+        assert base_source_fixture.name == "_testsource"
+
+    def test_make_request_reuses_session(self, mock_request_response, base_source_fixture):
+        mock_get = mock_request_response(
+            target_class=requests.Session, method_name="get", json_data={"ok": True}
+        )
+        session = base_source_fixture.session
+
+        base_source_fixture._make_request()
+        base_source_fixture._make_request()
+
+        assert mock_get.call_count == 2
+        assert base_source_fixture.session is session
+
+    def test_make_request_does_not_mutate_params(self, mock_request_response, base_source_fixture):
+        mock_get = mock_request_response(
+            target_class=requests.Session, method_name="get", json_data={"ok": True}
+        )
+        params = {"appid": "12345"}
+
+        base_source_fixture._make_request(params=params)
+
+        assert params == {"appid": "12345"}
+        sent_params = mock_get.call_args.kwargs["params"]
+        assert sent_params["appid"] == "12345"
+        assert "User-Agent" in sent_params
+
+    def test_random_user_agent_uses_cached_pool(self, monkeypatch):
+        base._user_agent_pool.cache_clear()
+        instantiations = []
+
+        class _FakeUserAgent:
+            def __init__(self):
+                instantiations.append(self)
+                self.random = "mock-agent"
+
+        monkeypatch.setattr(base, "UserAgent", _FakeUserAgent)
+
+        assert base.random_user_agent() == "mock-agent"
+        assert base.random_user_agent() == "mock-agent"
+        assert len(instantiations) == 1
+
+        base._user_agent_pool.cache_clear()
+
+    def test_random_user_agent_falls_back_on_error(self, monkeypatch):
+        base._user_agent_pool.cache_clear()
+
+        def _broken_user_agent():
+            raise RuntimeError("no data")
+
+        monkeypatch.setattr(base, "UserAgent", _broken_user_agent)
+
+        assert base.random_user_agent() in base._FALLBACK_USER_AGENTS
+
+        base._user_agent_pool.cache_clear()
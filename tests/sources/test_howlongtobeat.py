@@ -1,4 +1,8 @@
+import json
+import time
+
 import pytest
+import requests
 
 from gameinsights.sources import howlongtobeat
 from gameinsights.sources.howlongtobeat import HowLongToBeat
@@ -76,6 +80,94 @@ class TestHowLongToBeat:
         assert "error" in result
         assert result["error"] == "Game is not found."
 
+    def test_search_information_is_shared(self, monkeypatch):
+        instantiations = []
+
+        class CountingSearchInformation:
+            def __init__(self, *args, **kwargs):
+                instantiations.append(self)
+                self.api_key = "mock_api_key"
+                self.search_url = "api/s/"
+
+        monkeypatch.setattr(howlongtobeat, "SearchInformation", CountingSearchInformation)
+
+        first, second = HowLongToBeat(), HowLongToBeat()
+        # nothing is scraped until the first search
+        assert instantiations == []
+
+        assert first._search_information() is second._search_information()
+        assert len(instantiations) == 1
+
+        # expired entries are scraped again
+        monkeypatch.setattr(HowLongToBeat, "SEARCH_INFO_TTL", 0)
+        HowLongToBeat()._search_information()
+        assert len(instantiations) == 2
+
+    def test_failed_search_information_is_not_cached(self, monkeypatch):
+        instantiations = []
+
+        class FailedSearchInformation:
+            def __init__(self, *args, **kwargs):
+                instantiations.append(self)
+                self.api_key = None
+                self.search_url = None
+
+        monkeypatch.setattr(howlongtobeat, "SearchInformation", FailedSearchInformation)
+
+        HowLongToBeat()._search_information()
+        HowLongToBeat()._search_information()
+
+        assert len(instantiations) == 2
+
+    def test_failed_search_information_is_retried_on_same_instance(self, monkeypatch):
+        api_keys = iter([None, "mock_api_key"])
+
+        class FlakySearchInformation:
+            def __init__(self, *args, **kwargs):
+                self.api_key = next(api_keys)
+                self.search_url = "api/s/"
+
+        monkeypatch.setattr(howlongtobeat, "SearchInformation", FlakySearchInformation)
+        source = HowLongToBeat()
+
+        assert source._search_information().api_key is None
+        # the failed scrape isn't kept by the instance either
+        assert source._search_information().api_key == "mock_api_key"
+
+    def test_expired_search_information_is_refreshed_on_same_instance(self, monkeypatch):
+        instantiations = []
+
+        class CountingSearchInformation:
+            def __init__(self, *args, **kwargs):
+                instantiations.append(self)
+                self.api_key = "mock_api_key"
+                self.search_url = "api/s/"
+
+        monkeypatch.setattr(howlongtobeat, "SearchInformation", CountingSearchInformation)
+        source = HowLongToBeat()
+
+        first = source._search_information()
+        assert source._search_information() is first
+
+        monkeypatch.setattr(HowLongToBeat, "SEARCH_INFO_TTL", 0)
+        assert source._search_information() is not first
+        assert len(instantiations) == 2
+
+    def test_fetch_search_results_uses_session(
+        self, mock_request_response, hltb_success_response_data
+    ):
+        mock_post = mock_request_response(
+            target_class=requests.Session,
+            method_name="post",
+            text_data=hltb_success_response_data,
+        )
+
+        response = HowLongToBeat()._fetch_search_results("mock name")
+
+        assert response.status_code == 200
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.args[0] == HowLongToBeat.BASE_URL + "api/s/mock_api_key"
+
     def test_fetch_error_on_request(self, monkeypatch):
 
         def mock_method(*args, **kwargs):
@@ -89,3 +181,187 @@ class TestHowLongToBeat:
         assert result["success"] is False
         assert "error" in result
         assert result["error"] == "Failed to fetch data."
+
+    def test_transform_data_fills_missing_labels(self):
+        source = HowLongToBeat()
+
+        result = source._transform_data({"game_id": 1, "game_name": "Mock Game", "extra": "x"})
+
+        assert list(result) == list(howlongtobeat._HOWLONGTOBEAT_LABELS)
+        assert result["game_id"] == 1
+        assert result["game_name"] == "Mock Game"
+        assert result["comp_main"] is None
+
+    def test_generate_data_payload_does_not_mutate_template(self):
+        search_info = howlongtobeat.SearchInformation.__new__(howlongtobeat.SearchInformation)
+        search_info.api_key = "mock_api_key"
+        search_info.search_url = None
+
+        with_key = json.loads(HowLongToBeat._generate_data_payload("Mock Game", 2, search_info))
+        without_key = json.loads(HowLongToBeat._generate_data_payload("Mock Game", 1))
+
+        assert with_key["searchTerms"] == ["Mock", "Game"]
+        assert with_key["searchPage"] == 2
+        assert with_key["searchOptions"]["users"]["id"] == "mock_api_key"
+        assert "id" not in without_key["searchOptions"]["users"]
+        assert "id" not in howlongtobeat._SEARCH_OPTIONS["users"]
+
+    def test_request_headers_use_shared_user_agent_pool(self, monkeypatch):
+        monkeypatch.setattr(howlongtobeat, "random_user_agent", lambda: " mock-agent ")
+
+        title_headers = HowLongToBeat._get_title_request_headers()
+        search_headers = HowLongToBeat._get_search_request_headers()
+
+        assert title_headers["User-Agent"] == " mock-agent "
+        assert search_headers["User-Agent"] == "mock-agent"
+        assert search_headers["Referer"] == HowLongToBeat.REFERER_HEADER
+
+
+class TestSearchInformation:
+    HOMEPAGE = """
+    <html><head>
+    <script src="/_next/static/chunks/main-123.js"></script>
+    <script src="/_next/static/chunks/pages/_app-456.js"></script>
+    <script>inline()</script>
+    </head><body><div>content</div></body></html>
+    """
+    APP_SCRIPT = """
+    users:{id:"abc123"},
+    fetch("/api/find/".concat("abc").concat("123"), {method: "POST"})
+    """
+
+    def test_extracts_api_key_and_search_url(self, mock_request_response):
+        mock_get = mock_request_response(
+            target_class=requests.Session,
+            method_name="get",
+            side_effect=[{"text_data": self.HOMEPAGE}, {"text_data": self.APP_SCRIPT}],
+        )
+
+        search_info = howlongtobeat.SearchInformation(title_headers={})
+
+        assert search_info.api_key == "abc123"
+        assert search_info.search_url == "api/find/"
+        # the _app- script is checked first, the others are skipped once the key is found
+        assert mock_get.call_count == 2
+        assert "_app-456.js" in mock_get.call_args_list[1].args[0]
+
+    def test_missing_api_key(self, mock_request_response):
+        mock_request_response(
+            target_class=requests.Session,
+            method_name="get",
+            side_effect=[
+                {"text_data": self.HOMEPAGE},
+                {"text_data": "nothing here"},
+                {"text_data": "nothing here either"},
+            ],
+        )
+
+        search_info = howlongtobeat.SearchInformation(title_headers={})
+
+        assert search_info.api_key is None
+        assert search_info.search_url is None
+
+    def test_falls_back_to_other_scripts(self, mock_request_response):
+        mock_get = mock_request_response(
+            target_class=requests.Session,
+            method_name="get",
+            side_effect=[
+                {"text_data": self.HOMEPAGE},
+                {"text_data": "nothing here"},
+                {"text_data": self.APP_SCRIPT},
+            ],
+        )
+
+        search_info = howlongtobeat.SearchInformation(title_headers={})
+
+        assert search_info.api_key == "abc123"
+        assert search_info.search_url == "api/find/"
+        assert mock_get.call_count == 3
+        assert "main-123.js" in mock_get.call_args_list[2].args[0]
+
+    def test_fetches_candidate_scripts_concurrently(self, monkeypatch):
+        homepage = "".join(
+            f'<script src="/_next/static/chunks/pages/_app-{i}.js"></script>' for i in range(4)
+        )
+        requested = []
+
+        def mock_get(session, url, **kwargs):
+            requested.append(url)
+            response = requests.Response()
+            response.status_code = 200
+            if url == howlongtobeat.HowLongToBeat.BASE_URL:
+                text = homepage
+            elif url.endswith("_app-2.js"):
+                text = self.APP_SCRIPT
+            else:
+                text = "nothing here"
+            response._content = text.encode("utf-8")
+            return response
+
+        monkeypatch.setattr(requests.Session, "get", mock_get)
+
+        search_info = howlongtobeat.SearchInformation(title_headers={})
+
+        assert search_info.api_key == "abc123"
+        assert search_info.search_url == "api/find/"
+        assert len(requested) <= 5
+
+    def test_first_matching_script_in_document_order_wins(self, monkeypatch):
+        homepage = "".join(
+            f'<script src="/_next/static/chunks/pages/_app-{i}.js"></script>' for i in range(2)
+        )
+        other_script = self.APP_SCRIPT.replace("abc123", "xyz789").replace('"abc"', '"xyz"')
+        other_script = other_script.replace('"123"', '"789"')
+
+        def mock_get(session, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            if url == howlongtobeat.HowLongToBeat.BASE_URL:
+                text = homepage
+            elif url.endswith("_app-0.js"):
+                # the first script finishes last
+                time.sleep(0.05)
+                text = self.APP_SCRIPT
+            else:
+                text = other_script
+            response._content = text.encode("utf-8")
+            return response
+
+        monkeypatch.setattr(requests.Session, "get", mock_get)
+
+        search_info = howlongtobeat.SearchInformation(title_headers={})
+
+        assert search_info.api_key == "abc123"
+        assert search_info.search_url == "api/find/"
+
+    def test_session_is_closed_after_script_fetches_finish(self, monkeypatch):
+        homepage = "".join(
+            f'<script src="/_next/static/chunks/pages/_app-{i}.js"></script>' for i in range(4)
+        )
+        in_flight = []
+        in_flight_at_close = []
+
+        def mock_get(session, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            if url == howlongtobeat.HowLongToBeat.BASE_URL:
+                text = homepage
+            elif url.endswith("_app-0.js"):
+                text = self.APP_SCRIPT
+            else:
+                in_flight.append(url)
+                time.sleep(0.05)
+                in_flight.remove(url)
+                text = "nothing here"
+            response._content = text.encode("utf-8")
+            return response
+
+        monkeypatch.setattr(requests.Session, "get", mock_get)
+        monkeypatch.setattr(
+            requests.Session, "close", lambda session: in_flight_at_close.extend(in_flight)
+        )
+
+        search_info = howlongtobeat.SearchInformation(title_headers={})
+
+        assert search_info.api_key == "abc123"
+        assert in_flight_at_close == []
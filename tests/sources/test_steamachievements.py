@@ -1,3 +1,6 @@
+import threading
+from concurrent.futures import Future
+
 import pytest
 
 from gameinsights.sources.steamachievements import SteamAchievements
@@ -73,10 +76,10 @@ class Test_SteamAchievements:
     ):
         mock_kwargs = (
             {
-                "side_effect": [
-                    {"json_data": achievements_success_response_data},
-                    {"json_data": scheme_success_response_data},
-                ]
+                "side_effect": {
+                    None: {"json_data": achievements_success_response_data},
+                    SteamAchievements._schema_url: {"json_data": scheme_success_response_data},
+                }
             }
             if api_key
             else {"json_data": achievements_success_response_data}
@@ -129,10 +132,10 @@ class Test_SteamAchievements:
     ):
         mock_kwargs = (
             {
-                "side_effect": [
-                    {"status_code": achievements_status_code},
-                    {"status_code": schema_status_code},
-                ]
+                "side_effect": {
+                    None: {"status_code": achievements_status_code},
+                    SteamAchievements._schema_url: {"status_code": schema_status_code},
+                }
             }
             if api_key
             else {"status_code": achievements_status_code}
@@ -318,3 +321,52 @@ class Test_SteamAchievements:
 
         assert len(result) == len(expected_result)
         assert result == expected_result
+
+    def test_fetch_cancels_schema_request_on_failure(self, mock_request_response, monkeypatch):
+        mock_request_response(target_class=SteamAchievements, status_code=500)
+        submitted: list[Future] = []
+
+        class QueuedExecutor:
+            def submit(self, *args, **kwargs):
+                # stands for a schema request still waiting for a free pool thread
+                future: Future = Future()
+                submitted.append(future)
+                return future
+
+        monkeypatch.setattr(SteamAchievements, "_executor", QueuedExecutor())
+
+        result = SteamAchievements(api_key="mockapikey").fetch("12345", verbose=False)
+
+        assert result["success"] is False
+        assert len(submitted) == 1
+        assert submitted[0].cancelled()
+
+    def test_fetch_in_worker_thread_fetches_schema_inline(
+        self,
+        mock_request_response,
+        monkeypatch,
+        achievements_success_response_data,
+        scheme_success_response_data,
+    ):
+        mock_request_response(
+            target_class=SteamAchievements,
+            side_effect={
+                None: {"json_data": achievements_success_response_data},
+                SteamAchievements._schema_url: {"json_data": scheme_success_response_data},
+            },
+        )
+
+        class UnusedExecutor:
+            def submit(self, *args, **kwargs):
+                raise AssertionError("the schema request should not be queued from a worker")
+
+        monkeypatch.setattr(SteamAchievements, "_executor", UnusedExecutor())
+        source = SteamAchievements(api_key="mockapikey")
+        results = []
+
+        worker = threading.Thread(target=lambda: results.append(source.fetch("12345")))
+        worker.start()
+        worker.join(timeout=5)
+
+        assert results[0]["success"] is True
+        assert results[0]["data"]["achievements_list"][0]["display_name"] == "Mock One"
@@ -1,6 +1,6 @@
 import pytest
 
-from gameinsights.sources.steamcharts import SteamCharts
+from gameinsights.sources.steamcharts import SteamCharts, _to_iso_month
 
 
 class TestSteamCharts:
@@ -23,6 +23,14 @@ class TestSteamCharts:
         # check the number of labels
         assert len(result["data"]) == 5
 
+    @pytest.mark.parametrize(
+        "month, expected",
+        [("January 2024", "2024-01"), ("December 2012", "2012-12")],
+    )
+    def test_to_iso_month(self, month, expected):
+        # "YYYY-MM" sorts chronologically, the collector relies on it for the month columns
+        assert _to_iso_month(month) == expected
+
     @pytest.mark.parametrize(
         "selected_labels, expected_labels, expected_len",
         [
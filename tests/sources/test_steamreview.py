@@ -1,5 +1,6 @@
 import pytest
 
+from gameinsights.sources import steamreview
 from gameinsights.sources.steamreview import SteamReview
 
 
@@ -26,8 +27,11 @@ class TestSteamReview:
         ],
     )
     def test_fetch_mode_review(
-        self, source_fetcher, request, responses, language, expected_result
+        self, source_fetcher, request, monkeypatch, responses, language, expected_result
     ):
+        sleeps = []
+        monkeypatch.setattr(steamreview.time, "sleep", sleeps.append)
+
         if len(responses) > 1:
             mock_kwargs = {
                 "side_effect": [
@@ -52,6 +56,8 @@ class TestSteamReview:
             unique_languages.add(review["language"])
 
         assert len(unique_languages) == expected_result["unique_languages"]
+        # only paused between pages
+        assert len(sleeps) == len(responses) - 1
 
     @pytest.mark.parametrize(
         "selected_labels, expected_labels",
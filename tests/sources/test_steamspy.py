@@ -89,3 +89,22 @@ class TestSteamSpy:
         assert result["success"] is False
         assert "error" in result
         assert result["error"] == "Game with appid 12345 is not found."
+
+    def test_fetch_many(self, source_fetcher, steamspy_success_response_data):
+        result = source_fetcher(
+            SteamSpy,
+            method="fetch_many",
+            mock_kwargs={"json_data": steamspy_success_response_data},
+            call_kwargs={
+                "steam_appids": ["12345", 67890, "12345"],
+                "selected_labels": ["name"],
+                "max_workers": 2,
+            },
+        )
+
+        assert list(result) == ["12345", "67890"]
+        assert all(entry["success"] is True for entry in result.values())
+        assert all(list(entry["data"]) == ["name"] for entry in result.values())
+
+    def test_fetch_many_empty(self):
+        assert SteamSpy().fetch_many([]) == {}
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
+import sys
+import threading
 from pathlib import Path
 from typing import Any, Iterator
 
@@ -8,6 +12,7 @@ import pandas as pd
 import pytest
 
 from gameinsights import cli
+from gameinsights import collector as collector_module
 from gameinsights.collector import SourceConfig
 
 
@@ -20,11 +25,15 @@ class _DummyCollector:
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         steamstore = _DummySource("SteamStore")
         gamalytic = _DummySource("Gamalytic")
-        self._id_based_sources = [
-            SourceConfig(steamstore, ["steam_appid", "name", "price_final"]),
-            SourceConfig(gamalytic, ["copies_sold"]),
-        ]
-        self._name_based_sources: list[SourceConfig] = []
+        self._id_based_sources = (
+            SourceConfig(steamstore, ("steam_appid", "name", "price_final")),
+            SourceConfig(gamalytic, ("copies_sold",)),
+        )
+        self._name_based_sources: tuple[SourceConfig, ...] = ()
+        self._source_fields_map = {
+            "steamstore": frozenset({"steam_appid", "name", "price_final"}),
+            "gamalytic": frozenset({"copies_sold"}),
+        }
         self._records = [
             {
                 "steam_appid": "12345",
@@ -35,18 +44,27 @@ class _DummyCollector:
         ]
 
     @property
-    def id_based_sources(self) -> list[SourceConfig]:
+    def id_based_sources(self) -> tuple[SourceConfig, ...]:
         return self._id_based_sources
 
     @property
-    def name_based_sources(self) -> list[SourceConfig]:
+    def name_based_sources(self) -> tuple[SourceConfig, ...]:
         return self._name_based_sources
 
+    @property
+    def source_fields_map(self) -> dict[str, frozenset[str]]:
+        return self._source_fields_map
+
     def get_games_data(
         self, steam_appids: list[str], recap: bool = False, verbose: bool = False
     ) -> list[dict[str, Any]]:
         return self._records
 
+    def iter_games_data(
+        self, steam_appids: list[str], recap: bool = False, verbose: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        yield from self._records
+
     def get_games_active_player_data(
         self, steam_appids: list[str], verbose: bool = False
     ) -> pd.DataFrame:
@@ -59,7 +77,7 @@ class _DummyCollector:
 
 @pytest.fixture(autouse=True)
 def patched_collector(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
-    monkeypatch.setattr(cli, "Collector", _DummyCollector)
+    monkeypatch.setattr(collector_module, "Collector", _DummyCollector)
     yield
     monkeypatch.undo()
 
@@ -74,6 +92,38 @@ def test_cli_collect_games_json(capsys: pytest.CaptureFixture[str]) -> None:
     assert payload[0]["name"] == "Mock Game"
 
 
+def test_cli_collect_games_jsonl_with_source_filter(capsys: pytest.CaptureFixture[str]) -> None:
+    exit_code = cli.main(
+        ["collect", "--appid", "12345", "--format", "jsonl", "--source", "steamstore"]
+    )
+    assert exit_code == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record["name"] == "Mock Game"
+    assert "copies_sold" not in record
+
+
+def test_cli_collect_active_player_jsonl(tmp_path: Path) -> None:
+    output_path = tmp_path / "output.jsonl"
+    exit_code = cli.main(
+        [
+            "collect",
+            "--appid",
+            "12345",
+            "--mode",
+            "active-player",
+            "--format",
+            "jsonl",
+            "--output",
+            str(output_path),
+        ]
+    )
+    assert exit_code == 0
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["active_player_24h"] for line in lines] == [111]
+
+
 def test_cli_collect_games_csv(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     output_path = tmp_path / "output.csv"
     exit_code = cli.main(
@@ -99,6 +149,15 @@ def test_cli_collect_games_with_source_filter(capsys: pytest.CaptureFixture[str]
     assert "copies_sold" not in record
 
 
+def test_cli_collect_games_csv_with_source_filter(capsys: pytest.CaptureFixture[str]) -> None:
+    exit_code = cli.main(
+        ["collect", "--appid", "12345", "--format", "csv", "--source", "gamalytic"]
+    )
+    assert exit_code == 0
+    header = capsys.readouterr().out.splitlines()[0]
+    assert header == "steam_appid,copies_sold"
+
+
 def test_cli_collect_active_player(capsys: pytest.CaptureFixture[str]) -> None:
     exit_code = cli.main(
         ["collect", "--appid", "12345", "--mode", "active-player", "--format", "csv"]
@@ -109,8 +168,97 @@ def test_cli_collect_active_player(capsys: pytest.CaptureFixture[str]) -> None:
     assert "active_player_24h" in captured.out
 
 
+def test_cli_collect_active_player_json(capsys: pytest.CaptureFixture[str]) -> None:
+    exit_code = cli.main(
+        ["collect", "--appid", "12345", "--mode", "active-player", "--format", "json"]
+    )
+    assert exit_code == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload == [{"steam_appid": "12345", "active_player_24h": 111}]
+
+
 def test_cli_missing_appids(capsys: pytest.CaptureFixture[str]) -> None:
     exit_code = cli.main(["collect"])
     assert exit_code == 1
     stderr = capsys.readouterr().err
     assert "No appids supplied" in stderr
+
+
+def test_read_appids_dedupes_and_preserves_order(tmp_path: Path) -> None:
+    appid_file = tmp_path / "appids.txt"
+    appid_file.write_text("30, 10\n\n20\n10,40\n", encoding="utf-8")
+
+    appids = cli._read_appids(["20", " 50 ", ""], str(appid_file))
+
+    assert appids == ["20", "50", "30", "10", "40"]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "feather"])
+def test_cli_collect_games_binary_formats(tmp_path: Path, fmt: str) -> None:
+    pytest.importorskip("pyarrow")
+    output_path = tmp_path / f"output.{fmt}"
+    exit_code = cli.main(
+        ["collect", "--appid", "12345", "--format", fmt, "--output", str(output_path)]
+    )
+    assert exit_code == 0
+    frame = pd.read_parquet(output_path) if fmt == "parquet" else pd.read_feather(output_path)
+    assert frame["steam_appid"].tolist() == ["12345"]
+
+
+def test_cli_binary_format_requires_output(capsys: pytest.CaptureFixture[str]) -> None:
+    exit_code = cli.main(["collect", "--appid", "12345", "--format", "parquet"])
+    assert exit_code == 1
+    assert "requires --output" in capsys.readouterr().err
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_read_appids_from_pipe(tmp_path: Path) -> None:
+    fifo = tmp_path / "appids.fifo"
+    os.mkfifo(fifo)
+
+    def _write() -> None:
+        with fifo.open("w", encoding="utf-8") as handle:
+            handle.write("570, 730\n570\n")
+
+    writer = threading.Thread(target=_write)
+    writer.start()
+    try:
+        appids = cli._read_appids([], str(fifo))
+    finally:
+        writer.join(timeout=5)
+
+    assert appids == ["570", "730"]
+
+
+def test_read_appids_empty_file(tmp_path: Path) -> None:
+    appid_file = tmp_path / "empty.txt"
+    appid_file.write_text("", encoding="utf-8")
+
+    assert cli._read_appids(["10"], str(appid_file)) == ["10"]
+
+
+def test_cli_import_does_not_load_pandas() -> None:
+    code = "import sys, gameinsights.cli; assert 'pandas' not in sys.modules"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_output_data_json_keeps_non_ascii(tmp_path: Path) -> None:
+    output_path = tmp_path / "output.json"
+
+    cli._output_data([{"name": "ゲーム"}], "json", str(output_path))
+
+    assert "ゲーム" in output_path.read_text(encoding="utf-8")
+
+
+def test_games_frame_uses_model_columns_and_nullable_ints() -> None:
+    from gameinsights.model import GameDataModel
+
+    frame = cli._games_frame(
+        [{"steam_appid": "1", "copies_sold": 10}, {"steam_appid": "2"}], recap=True
+    )
+
+    assert list(frame.columns) == list(GameDataModel._RECAP_FIELDS)
+    assert str(frame["copies_sold"].dtype) == "Int64"
+    assert frame["copies_sold"].isna().tolist() == [False, True]
+    assert frame["copies_sold"].iloc[0] == 10
@@ -1,9 +1,61 @@
+import subprocess
+import sys
+import threading
+
 import pandas as pd
 import pytest
 
+from gameinsights.collector import Collector, SourceConfig
 from gameinsights.model import GameDataModel
 
 
+class TestSourceConfig:
+    @pytest.mark.parametrize(
+        "fields, expected",
+        [
+            (("a", "b"), [("a", 1), ("b", 2)]),
+            (("b",), [("b", 2)]),
+            ((), []),
+            (("a", "missing", "c"), [("a", 1), ("c", 3)]),
+            (("missing",), []),
+        ],
+        ids=[
+            "multiple_fields",
+            "single_field",
+            "no_fields",
+            "partial_fields",
+            "missing_single_field",
+        ],
+    )
+    def test_extract(self, fields, expected):
+        config = SourceConfig(source=None, fields=fields)
+
+        assert list(config.extract({"a": 1, "b": 2, "c": 3})) == expected
+
+
+def test_collector_import_does_not_load_pandas() -> None:
+    code = "import sys, gameinsights.collector; assert 'pandas' not in sys.modules"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+class TestCollectorRateLimits:
+    def test_rate_limits_override_source_budget(self):
+        collector = Collector(rate_limits={"steamspy": (30, 60)})
+
+        assert collector.steamspy.rate_limit == (30, 60)
+        assert collector.steamstore.rate_limit is None
+
+    @pytest.mark.parametrize(
+        "rate_limits",
+        [{"unknown": (1, 1)}, {"steamspy": (0, 60)}],
+        ids=["unknown_source", "non_positive_budget"],
+    )
+    def test_rate_limits_invalid(self, rate_limits):
+        with pytest.raises(ValueError):
+            Collector(rate_limits=rate_limits)
+
+
 class TestCollector:
 
     def test_fetch_raw_data(self, collector_with_mocks):
@@ -11,6 +63,97 @@ class TestCollector:
 
         assert isinstance(raw_data, GameDataModel)
 
+    def test_fetch_raw_data_starts_name_sources_early(self, collector_with_mocks, monkeypatch):
+        name_fetch_started = threading.Event()
+        original_hltb_fetch = collector_with_mocks.howlongtobeat.fetch
+        original_steamspy_fetch = collector_with_mocks.steamspy.fetch
+
+        def hltb_fetch(*args, **kwargs):
+            name_fetch_started.set()
+            return original_hltb_fetch(*args, **kwargs)
+
+        def slow_steamspy_fetch(*args, **kwargs):
+            # only finishes once the name-based fetch is running alongside it
+            assert name_fetch_started.wait(timeout=5)
+            return original_steamspy_fetch(*args, **kwargs)
+
+        monkeypatch.setattr(collector_with_mocks.howlongtobeat, "fetch", hltb_fetch)
+        monkeypatch.setattr(collector_with_mocks.steamspy, "fetch", slow_steamspy_fetch)
+
+        raw_data = collector_with_mocks._fetch_raw_data(steam_appid="12345")
+
+        assert raw_data.name is not None
+        assert name_fetch_started.is_set()
+
+    def test_fetch_raw_data_is_cached(self, collector_with_mocks, monkeypatch):
+        calls = []
+        original_fetch = collector_with_mocks.steamstore.fetch
+
+        def counting_fetch(*args, **kwargs):
+            calls.append(args)
+            return original_fetch(*args, **kwargs)
+
+        monkeypatch.setattr(collector_with_mocks.steamstore, "fetch", counting_fetch)
+
+        first = collector_with_mocks._fetch_raw_data(steam_appid="12345")
+        second = collector_with_mocks._fetch_raw_data(steam_appid="12345")
+        assert second is first
+        assert len(calls) == 1
+
+        # changing a setting that affects the data drops the cache
+        collector_with_mocks.region = "id"
+        collector_with_mocks._fetch_raw_data(steam_appid="12345")
+        assert len(calls) == 2
+
+        collector_with_mocks.clear_cache()
+        collector_with_mocks._fetch_raw_data(steam_appid="12345")
+        assert len(calls) == 3
+
+    @pytest.mark.parametrize("recap", [True, False], ids=["recap", "full"])
+    def test_cached_game_is_not_changed_through_results(self, collector_with_mocks, recap):
+        first = collector_with_mocks.get_games_data(["12345"], recap=recap)[0]
+        first["genres"].append("mutated")
+        first["developers"].append("mutated")
+
+        second = collector_with_mocks.get_games_data(["12345"], recap=recap)[0]
+
+        assert "mutated" not in second["genres"]
+        assert "mutated" not in second["developers"]
+        assert "mutated" not in collector_with_mocks._fetch_raw_data("12345").genres
+
+    def test_fetch_raw_data_skips_empty_source_data(self, collector_with_mocks, monkeypatch):
+        monkeypatch.setattr(
+            collector_with_mocks.steamspy,
+            "fetch",
+            lambda *args, **kwargs: {"success": True, "data": {}},
+        )
+
+        raw_data = collector_with_mocks._fetch_raw_data(steam_appid="12345")
+
+        assert raw_data.name is not None
+        assert raw_data.tags == []
+
+    def test_fetch_raw_data_is_only_paced_per_source(self, collector_with_mocks, fake_clock):
+        # a single-call collector budget no longer throttles game fetches
+        collector_with_mocks.calls = 1
+        for appid in ("111", "222", "333"):
+            collector_with_mocks._fetch_raw_data(steam_appid=appid)
+
+        assert fake_clock.sleeps == []
+
+    def test_source_fields_map(self, collector_with_mocks):
+        fields_map = collector_with_mocks.source_fields_map
+
+        assert fields_map["steamspy"] == frozenset({"ccu", "tags"})
+        assert "comp_main" in fields_map["howlongtobeat"]
+        assert set(fields_map) == {
+            config.source.name
+            for config in (
+                *collector_with_mocks.id_based_sources,
+                *collector_with_mocks.name_based_sources,
+            )
+        }
+
     @pytest.mark.parametrize(
         "appids, expected_len",
         [("12345", 1), (["12345", "12345"], 2), ([], 0)],
@@ -41,6 +184,151 @@ class TestCollector:
             assert "steam_appid" in active_player_data.columns
             assert active_player_data["steam_appid"].iloc[0] == "12345"
 
+    @pytest.mark.parametrize("max_workers", [1, 4], ids=["serial", "threaded"])
+    def test_get_games_active_player_data_preserves_order(self, collector_with_mocks, max_workers):
+        collector_with_mocks.max_workers = max_workers
+        appids = ["111", "222", "333", "444", "555"]
+
+        active_player_data = collector_with_mocks.get_games_active_player_data(steam_appids=appids)
+
+        assert active_player_data["steam_appid"].tolist() == appids
+
+    def test_get_games_active_player_data_aligns_months(self, collector_with_mocks, monkeypatch):
+        monthly = {
+            "111": [{"month": "2024-02", "average_players": 20.5}],
+            "222": [
+                {"month": "2024-01", "average_players": 10.0},
+                {"month": "2024-02", "average_players": 12.0},
+            ],
+        }
+
+        def fake_fetch(appid, verbose=True, selected_labels=None):
+            return {
+                "success": True,
+                "data": {
+                    "name": f"game {appid}",
+                    "peak_active_player_all_time": 100,
+                    "monthly_active_player": monthly[appid],
+                },
+            }
+
+        monkeypatch.setattr(collector_with_mocks.steamcharts, "fetch", fake_fetch)
+
+        df = collector_with_mocks.get_games_active_player_data(["111", "222"], fill_na_as=-1)
+
+        assert df.columns.tolist() == [
+            "steam_appid",
+            "name",
+            "peak_active_player_all_time",
+            "2024-01",
+            "2024-02",
+        ]
+        assert df["2024-01"].tolist() == [-1.0, 10.0]
+        assert df["2024-02"].tolist() == [20.5, 12.0]
+        assert df["peak_active_player_all_time"].tolist() == [100, 100]
+
+    def test_iter_games_data(self, collector_with_mocks, monkeypatch):
+        def fake_fetch_raw_data(steam_appid, verbose=True, now=None):
+            if steam_appid == "222":
+                raise ValueError("boom")
+            return GameDataModel(steam_appid=steam_appid, name=f"game {steam_appid}")
+
+        monkeypatch.setattr(collector_with_mocks, "_fetch_raw_data", fake_fetch_raw_data)
+
+        games = collector_with_mocks.iter_games_data(["111", "222", "333", "111"], recap=True)
+
+        assert not isinstance(games, list)
+        assert [game["steam_appid"] for game in games] == ["111", "333"]
+
+    def test_get_games_data_fetches_duplicates_once(self, collector_with_mocks, monkeypatch):
+        fetched = []
+        original_fetch_raw_data = collector_with_mocks._fetch_raw_data
+
+        def counting_fetch_raw_data(steam_appid, verbose=True, now=None):
+            fetched.append(steam_appid)
+            return original_fetch_raw_data(steam_appid, verbose=verbose, now=now)
+
+        monkeypatch.setattr(collector_with_mocks, "_fetch_raw_data", counting_fetch_raw_data)
+
+        games = collector_with_mocks.get_games_data(["12345", "67890", "12345"], recap=True)
+
+        assert sorted(fetched) == ["12345", "67890"]
+        assert [game["steam_appid"] for game in games] == ["12345", "67890", "12345"]
+        assert games[0] == games[2]
+        assert games[0] is not games[2]
+        # nested containers aren't shared between the duplicates either
+        games[0]["genres"].append("mutated")
+        assert "mutated" not in games[2]["genres"]
+
+    def test_get_games_active_player_data_fetches_duplicates_once(
+        self, collector_with_mocks, monkeypatch
+    ):
+        fetched = []
+        original_fetch = collector_with_mocks.steamcharts.fetch
+
+        def counting_fetch(appid, *args, **kwargs):
+            fetched.append(appid)
+            return original_fetch(appid, *args, **kwargs)
+
+        monkeypatch.setattr(collector_with_mocks.steamcharts, "fetch", counting_fetch)
+
+        df = collector_with_mocks.get_games_active_player_data(["111", "222", "111"])
+
+        assert sorted(fetched) == ["111", "222"]
+        assert df["steam_appid"].tolist() == ["111", "222", "111"]
+
+    def test_get_user_data(self, collector_with_mocks, monkeypatch):
+        def fake_fetch(steamid, include_free_games=True, verbose=True):
+            if steamid == "2":
+                return {"success": False, "error": "not found"}
+            return {"success": True, "data": {"steamid": steamid, "persona_name": "mock"}}
+
+        monkeypatch.setattr(collector_with_mocks.steamuser, "fetch", fake_fetch)
+
+        users = collector_with_mocks.get_user_data(["1", "2", "3"], return_as="list")
+
+        assert users == [
+            {"steamid": "1", "persona_name": "mock"},
+            {"steamid": "2"},
+            {"steamid": "3", "persona_name": "mock"},
+        ]
+
+    def test_get_user_data_dataframe_dtypes(self, collector_with_mocks, monkeypatch):
+        def fake_fetch(steamid, include_free_games=True, verbose=True):
+            if steamid == "2":
+                return {"success": False, "error": "not found"}
+            return {
+                "success": True,
+                "data": {"steamid": steamid, "community_visibility_state": 3, "time_created": 1},
+            }
+
+        monkeypatch.setattr(collector_with_mocks.steamuser, "fetch", fake_fetch)
+
+        df = collector_with_mocks.get_user_data(["1", "2"])
+
+        assert df.columns.tolist() == list(collector_with_mocks.steamuser.valid_labels)
+        # the failed user doesn't turn the int columns into floats
+        assert str(df["time_created"].dtype) == "Int64"
+        assert df["community_visibility_state"].tolist() == [3, pd.NA]
+
+    def test_get_user_data_fetches_duplicates_once(self, collector_with_mocks, monkeypatch):
+        fetched = []
+
+        def fake_fetch(steamid, include_free_games=True, verbose=True):
+            fetched.append(steamid)
+            return {"success": True, "data": {"steamid": steamid, "owned_games": {"games": []}}}
+
+        monkeypatch.setattr(collector_with_mocks.steamuser, "fetch", fake_fetch)
+
+        users = collector_with_mocks.get_user_data(["1", "2", "1"], return_as="list")
+
+        assert sorted(fetched) == ["1", "2"]
+        assert [user["steamid"] for user in users] == ["1", "2", "1"]
+        assert users[0] == users[2]
+        assert users[0] is not users[2]
+        users[0]["owned_games"]["games"].append(570)
+        assert users[2]["owned_games"]["games"] == []
+
     @pytest.mark.parametrize(
         "review_only, has_reviews_labels",
         [(True, False), (False, True)],
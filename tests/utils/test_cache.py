@@ -0,0 +1,46 @@
+from gameinsights.utils import cache as cache_module
+from gameinsights.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_and_set(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+    def test_evicts_least_recently_used(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_entries_expire(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+
+        cache.set("a", 1)
+        now[0] += 9
+        assert cache.get("a") == 1
+        now[0] += 1
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_disabled_and_clear(self):
+        disabled: TTLCache[str, int] = TTLCache(maxsize=2, ttl=0)
+        disabled.set("a", 1)
+        assert disabled.get("a") is None
+
+        cache: TTLCache[str, int] = TTLCache()
+        cache.set("a", 1)
+        cache.clear()
+        assert cache.get("a") is None
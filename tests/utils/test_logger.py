@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import logging
+from pathlib import PurePosixPath
+from typing import Any
 
 import pytest
 
@@ -63,18 +65,184 @@ def test_metrics_collector_emits_when_enabled(
         collector.counter("test_counter", source="steamstore")
         with collector.timer("test_timer_seconds", source="steamstore"):
             pass
+        collector.flush()
 
-    counter_record = next(
-        rec for rec in caplog.records if '"metric": "test_counter"' in rec.message
-    )
-    counter_payload = json.loads(counter_record.message)
+    payloads = {
+        payload["metric"]: payload
+        for payload in (
+            json.loads(rec.message) for rec in caplog.records if rec.name == "gameinsights.metrics"
+        )
+    }
+
+    counter_payload = payloads["test_counter"]
     assert counter_payload["type"] == "counter"
     assert counter_payload["labels"]["source"] == "steamstore"
 
-    timer_record = next(
-        rec for rec in caplog.records if '"metric": "test_timer_seconds"' in rec.message
-    )
-    timer_payload = json.loads(timer_record.message)
+    timer_payload = payloads["test_timer_seconds"]
     assert timer_payload["type"] == "observation"
     assert timer_payload["labels"]["source"] == "steamstore"
     assert timer_payload["value"] >= 0.0
+
+
+def test_logger_wrapper_keeps_context_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GAMEINSIGHTS_LOG_JSON", raising=False)
+    logger = LoggerWrapper("OrderedLogger")
+
+    formatted = logger._format_message(
+        "fetch complete", {"source": "steamstore", "appid": 10, "labels": ["a"], "extra": None}
+    )
+
+    assert formatted == "fetch complete | source=steamstore appid=10 labels=['a'] extra=None"
+    assert logger._format_message("no context", {}) == "no context"
+
+
+def test_logger_wrapper_skips_formatting_below_level(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GAMEINSIGHTS_LOG_JSON", raising=False)
+    logger = LoggerWrapper("LevelLogger")
+
+    messages: list[str] = []
+
+    class CaptureHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            messages.append(record.getMessage())
+
+    logger._logger.handlers = [CaptureHandler()]
+    logger._logger.setLevel(logging.WARNING)
+
+    def _fail_format(*args: object) -> str:
+        raise AssertionError("message should not be formatted")
+
+    monkeypatch.setattr(logger, "_format_message", _fail_format)
+
+    logger.log("debug detail", level="debug", verbose=True, source="steamstore")
+    logger.log("info detail", level="info", verbose=True, source="steamstore")
+    assert messages == []
+
+    monkeypatch.undo()
+    logger.log("something odd", level="warning", verbose=True)
+    assert messages == ["something odd"]
+
+
+def test_logger_wrapper_json_mode_handles_unserializable_context(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("GAMEINSIGHTS_LOG_JSON", "1")
+    logger = LoggerWrapper("JsonFallbackLogger")
+
+    class Opaque:
+        def __repr__(self) -> str:
+            return "<opaque>"
+
+    formatted = logger._format_message("fetch done", {"value": Opaque(), "counts": {1: 2}})
+
+    payload = json.loads(formatted)
+    assert payload["value"] == "<opaque>"
+    assert payload["counts"] == {"1": 2}
+
+
+def test_logger_wrapper_json_mode_renders_unknown_types_with_str(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("GAMEINSIGHTS_LOG_JSON", "1")
+    logger = LoggerWrapper("JsonStrLogger")
+
+    formatted = logger._format_message(
+        "wrote output", {"path": PurePosixPath("/x"), "steamid": 2**70}
+    )
+
+    payload = json.loads(formatted)
+    assert payload["path"] == "/x"
+    assert payload["steamid"] == 2**70
+
+
+def test_logger_wrapper_json_mode_handles_wide_integers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("GAMEINSIGHTS_LOG_JSON", "1")
+    logger = LoggerWrapper("JsonWideIntLogger")
+
+    formatted = logger._format_message("fetch done", {"steamid": 2**70, "source": "steamuser"})
+
+    payload = json.loads(formatted)
+    assert payload["steamid"] == 2**70
+    assert payload["source"] == "steamuser"
+
+
+def test_metrics_collector_keeps_draining_after_unencodable_metric(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("GAMEINSIGHTS_METRICS", "1")
+    collector = MetricsCollector()
+    circular: list[Any] = []
+    circular.append(circular)
+
+    with caplog.at_level(logging.INFO, logger="gameinsights.metrics"):
+        collector.observe("wide_value", 2**70)
+        collector.observe("circular_labels", 1.0, loop=circular)
+        collector.counter("after")
+        collector.flush()
+
+    assert collector._drainer is not None and collector._drainer.is_alive()
+    payloads = {
+        payload["metric"]: payload
+        for payload in (
+            json.loads(rec.message) for rec in caplog.records if rec.name == "gameinsights.metrics"
+        )
+    }
+    assert payloads["wide_value"]["value"] == 2**70
+    assert "circular_labels" in payloads
+    assert payloads["after"]["type"] == "counter"
+
+
+def test_metrics_collector_disabled_skips_emit_but_times(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GAMEINSIGHTS_METRICS", raising=False)
+    collector = MetricsCollector()
+
+    assert collector.enabled is False
+    with caplog.at_level(logging.INFO, logger="gameinsights.metrics"):
+        collector.counter("test_counter", source="steamstore")
+        collector.observe("test_observation", 1.0, source="steamstore")
+        with collector.timer("test_timer_seconds", source="steamstore") as timing:
+            pass
+
+    assert not [rec for rec in caplog.records if rec.name == "gameinsights.metrics"]
+    assert timing.duration >= 0.0
+    assert isinstance(timing.duration_ns, int)
+    assert timing.duration == timing.duration_ns * 1e-9
+
+
+def test_timer_result_duration_is_a_field() -> None:
+    from gameinsights.utils.metrics import TimerResult
+
+    result = TimerResult(duration=1.5)
+    assert result.duration == 1.5
+
+    result.duration = 2.0
+    assert result.duration == 2.0
+    assert TimerResult(0.25).duration == 0.25
+
+
+def test_metrics_batch_handler_writes_once_per_flush() -> None:
+    from gameinsights.utils.metrics import _BatchStreamHandler
+
+    writes: list[str] = []
+
+    class Stream:
+        def write(self, data: str) -> None:
+            writes.append(data)
+
+        def flush(self) -> None:
+            pass
+
+    handler = _BatchStreamHandler()
+    handler.setStream(Stream())
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    for idx in range(3):
+        handler.handle(logging.makeLogRecord({"msg": f"line {idx}", "levelno": logging.INFO}))
+    assert writes == []
+
+    handler.flush()
+    assert writes == ["line 0\nline 1\nline 2\n"]
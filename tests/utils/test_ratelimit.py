@@ -3,16 +3,9 @@ import pytest
 
 class TestRateLimit:
 
-    def test_logged_rate_limited_allows_calls_within_budget(self, stub_ratelimit, monkeypatch):
+    def test_logged_rate_limited_allows_calls_within_budget(self, fake_clock):
         from gameinsights.utils.ratelimit import logged_rate_limited
 
-        sleep_calls = []
-
-        def fake_sleep(duration):
-            sleep_calls.append(duration)
-
-        monkeypatch.setattr("gameinsights.utils.ratelimit.time.sleep", fake_sleep)
-
         class Dummy:
             def __init__(self):
                 self.calls = 2
@@ -27,18 +20,11 @@ class TestRateLimit:
         assert dummy.do_work() == "ok"
         assert dummy.do_work() == "ok"
 
-        assert sleep_calls == []
-        assert stub_ratelimit.limits_invocations == 1
+        assert fake_clock.sleeps == []
 
-    def test_logged_rate_limited_retries_and_logs(self, stub_ratelimit, monkeypatch, caplog):
+    def test_logged_rate_limited_retries_and_logs(self, fake_clock, caplog):
         from gameinsights.utils.ratelimit import logged_rate_limited
 
-        sleep_calls = []
-
-        def fake_sleep(duration):
-            sleep_calls.append(duration)
-
-        monkeypatch.setattr("gameinsights.utils.ratelimit.time.sleep", fake_sleep)
         caplog.set_level("INFO")
 
         class Dummy:
@@ -57,10 +43,31 @@ class TestRateLimit:
         assert dummy.do_work() == 1
         assert dummy.do_work() == 2
 
-        assert sleep_calls == [float(dummy.period)]
+        assert fake_clock.sleeps == [pytest.approx(float(dummy.period))]
         assert any("Rate limit exceeded" in message for message in caplog.messages)
 
-    def test_logged_rate_limited_caches_per_instance(self, stub_ratelimit):
+    def test_logged_rate_limited_refills_over_time(self, fake_clock):
+        from gameinsights.utils.ratelimit import logged_rate_limited
+
+        class Dummy:
+            calls = 2
+            period = 10
+
+            @logged_rate_limited()
+            def do_work(self):
+                return None
+
+        dummy = Dummy()
+
+        dummy.do_work()
+        dummy.do_work()
+        # half the period refills one token
+        fake_clock.now += 5
+        dummy.do_work()
+
+        assert fake_clock.sleeps == []
+
+    def test_logged_rate_limited_caches_per_instance(self, fake_clock):
         from gameinsights.utils.ratelimit import logged_rate_limited
 
         class Dummy:
@@ -72,19 +79,45 @@ class TestRateLimit:
             def do_work(self):
                 return None
 
+        bucket_attr = "__logged_rate_limit_bucket_do_work"
         dummy = Dummy()
+        other = Dummy()
 
         dummy.do_work()
-        assert stub_ratelimit.limits_invocations == 1
+        bucket = getattr(dummy, bucket_attr)
 
         dummy.do_work()
-        assert stub_ratelimit.limits_invocations == 1
+        assert getattr(dummy, bucket_attr) is bucket
+
+        other.do_work()
+        assert getattr(other, bucket_attr) is not bucket
 
+        # the rate is frozen once the bucket exists
         dummy.calls = 2
         dummy.do_work()
-        assert stub_ratelimit.limits_invocations == 2
+        assert getattr(dummy, bucket_attr) is bucket
+        assert bucket.calls == 1
+
+    def test_logged_rate_limited_instance_override(self, fake_clock):
+        from gameinsights.utils.ratelimit import logged_rate_limited
+
+        class Dummy:
+            rate_limit = None
+
+            @logged_rate_limited(calls=1, period=60)
+            def do_work(self):
+                return None
+
+        dummy = Dummy()
+        dummy.rate_limit = (2, 60)
+
+        dummy.do_work()
+        dummy.do_work()
+        # the decorator's single call budget would have slept on the second call
+        assert fake_clock.sleeps == []
+        assert getattr(dummy, "__logged_rate_limit_bucket_do_work").calls == 2
 
-    def test_logged_rate_limited_propagates_non_ratelimit_error(self, stub_ratelimit):
+    def test_logged_rate_limited_propagates_non_ratelimit_error(self, fake_clock):
         from gameinsights.utils.ratelimit import logged_rate_limited
 
         class Dummy:
@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+from gameinsights.utils import serialization
+
+
+class TestSerialization:
+    def test_dumps_round_trips(self):
+        payload = {"appid": "570", "count": 3, "tags": ["a", "b"]}
+
+        assert serialization.loads(serialization.dumps(payload)) == payload
+
+    def test_dumps_falls_back_for_wide_integers(self):
+        payload = {"steamid": 2**70, "name": "Dota 2"}
+
+        encoded = serialization.dumps(payload, default=str)
+
+        assert json.loads(encoded) == payload
+        # stays compact like orjson's output
+        assert b" " not in encoded.replace(b"Dota 2", b"")
+
+    def test_dumps_fallback_keeps_indent(self):
+        encoded = serialization.dumps({"value": 2**70}, option=serialization.OPT_INDENT_2)
+
+        assert encoded.decode() == '{\n  "value": 1180591620717411303424\n}'
+
+    def test_dumps_still_raises_for_unserializable(self):
+        with pytest.raises(TypeError):
+            serialization.dumps({"value": object()})